@@ -1,9 +1,26 @@
+from functools import lru_cache
 from typing import Any
 
 from elyx.contracts.collections import ArrayAccess
 from elyx.support import Macroable
 
 
+@lru_cache(maxsize=1024)
+def _key_segments(key: str) -> tuple[str | int, ...]:
+    """
+    Split a "dot" notation key into the segments used to walk an array.
+
+    The same keys are read over and over, so each one is only split once.
+
+    Args:
+        key: Key in dot notation (e.g., 'app.name').
+
+    Returns:
+        Tuple of segments, with numeric segments converted to integers.
+    """
+    return tuple(int(segment) if segment.isdigit() else segment for segment in key.split("."))
+
+
 class Arr(Macroable):
     """Array helper utilities."""
 
@@ -87,10 +104,7 @@ class Arr(Macroable):
         if not isinstance(key, str) or "." not in key:
             return False
 
-        for segment in key.split("."):
-            if segment.isdigit():
-                segment = int(segment)
-
+        for segment in _key_segments(key):
             if Arr.accessible(array) and Arr.exists(array, segment):
                 array = Arr._normalize_to_dict(array[segment])
             else:
@@ -129,10 +143,7 @@ class Arr(Macroable):
         if not isinstance(key, str) or "." not in key:
             return value(default)
 
-        for segment in key.split("."):
-            if segment.isdigit():
-                segment = int(segment)
-
+        for segment in _key_segments(key):
             if Arr.accessible(array) and Arr.exists(array, segment):
                 array = Arr._normalize_to_dict(array[segment])
             else:
@@ -162,21 +173,17 @@ class Arr(Macroable):
             array[key] = value
             return array
 
-        keys = key.split(".")
+        *parents, segment = key.split(".")
         current = array
 
-        while len(keys) > 1:
-            segment = keys.pop(0)
-
+        for parent in parents:
             # If the key doesn't exist at this depth, create an empty dict
-            if not isinstance(current, dict) or not Arr.exists(current, segment):
-                current[segment] = {}
-
-            if segment not in current or not Arr.accessible(current[segment]):
-                current[segment] = {}
-            current = current[segment]
+            if not isinstance(current, dict) or not Arr.exists(current, parent):
+                current[parent] = {}
 
-        segment = keys[0]
+            if parent not in current or not Arr.accessible(current[parent]):
+                current[parent] = {}
+            current = current[parent]
 
         current[segment] = value
 
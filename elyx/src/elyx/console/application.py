@@ -54,13 +54,13 @@ class Application(ApplicationContract):
         """
 
         # Check if command exists
-        if command not in self._commands:
+        command_class = self._commands.get(command)
+        if command_class is None:
             self._output = f"Command '{command}' not found."
             return 1
 
         # try:
         # Resolve the command from container
-        command_class = self._commands[command]
         command_instance = self.elyx.make(command_class)
 
         command_instance.set_elyx(self.get_elyx())
@@ -1,21 +1,214 @@
 import inspect
+import sys
 import types
+from contextvars import ContextVar
+from functools import lru_cache
 from typing import Any, Callable, TypeVar, Union, get_args, get_origin
 
 from elyx.collections import Arr
 from elyx.container.contextual_binding_builder import ContextualBindingBuilder
 from elyx.contracts.container import Container as ContainerContract
-from elyx.exceptions import EntryNotFoundException
+from elyx.exceptions import CircularDependencyException, EntryNotFoundException
 from elyx.support import Str
 
 T = TypeVar("T")
 
+# Sentinel for instance lookups, since None is a valid registered instance
+_MISSING = object()
+
+# The (container id, abstract) pairs being built in the current thread or task
+_resolving: ContextVar[frozenset[tuple[int, Any]]] = ContextVar("elyx_container_resolving", default=frozenset())
+
+
+def _intern_key(key: Any) -> Any:
+    """
+    Intern a string key so that lookups with an equal key can match on identity.
+
+    Args:
+        key: The normalized abstract key.
+
+    Returns:
+        The interned key, or the key unchanged if it is not a plain string.
+    """
+    return sys.intern(key) if type(key) is str else key
+
+
+def _resolvable_type(annotation: Any) -> Any:
+    """
+    Get the type a parameter annotation asks the container for.
+
+    Args:
+        annotation: The parameter annotation.
+
+    Returns:
+        The annotation, with Optional[T] unwrapped to T.
+    """
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        args = get_args(annotation)
+        non_none_args = [arg for arg in args if arg is not types.NoneType]
+        if len(args) > len(non_none_args) and len(non_none_args) == 1:
+            return non_none_args[0]
+
+    return annotation
+
+
+def _evaluate_annotation(annotation: str, target: Callable) -> Any:
+    """
+    Evaluate a string annotation in the namespace of the callable that declares it.
+
+    Args:
+        annotation: The string annotation.
+        target: The callable the annotation belongs to.
+
+    Returns:
+        The annotated class, or the string itself when it does not name a class in scope.
+    """
+    try:
+        result = _resolvable_type(eval(annotation, getattr(target, "__globals__", {})))
+    except Exception:
+        # Strings that cannot be evaluated keep working as container keys
+        return annotation
+
+    if isinstance(result, str):
+        # A quoted annotation in a PEP 563 module is a string holding another string
+        return _evaluate_annotation(result, target)
+
+    # A string naming a module or any other global may still be a container key, so only classes replace it
+    return result if isinstance(result, type) else annotation
+
+
+@lru_cache(maxsize=1024)
+def _cached_plan(target: Callable) -> tuple[tuple[inspect.Parameter, Any], ...]:
+    """
+    Get the dependency plan of a callable, inspecting each callable only once.
+
+    Args:
+        target: The callable to inspect.
+
+    Returns:
+        Tuple of (parameter, type_to_resolve) pairs, in signature order.
+    """
+    evaluate = inspect.isfunction(target)
+
+    # String annotations (PEP 563 modules, quoted forward references) are evaluated once here, each on its own,
+    # so they resolve to their classes instead of being looked up as string keys
+    return tuple(
+        (
+            param,
+            _resolvable_type(
+                _evaluate_annotation(param.annotation, target)
+                if evaluate and isinstance(param.annotation, str)
+                else param.annotation
+            ),
+        )
+        for param in inspect.signature(target).parameters.values()
+    )
+
+
+def _plan(target: Callable) -> tuple[tuple[inspect.Parameter, Any], ...]:
+    """
+    Get the dependency plan of a callable: each parameter paired with the type to resolve for it.
+
+    Bound methods are inspected through their function, so every instance shares one cache entry;
+    the bound first parameter is dropped again.
+
+    Args:
+        target: The callable to inspect.
+
+    Returns:
+        Tuple of (parameter, type_to_resolve) pairs, in signature order.
+
+    Raises:
+        ValueError: If no signature can be provided for the callable.
+        TypeError: If the callable is not supported by inspect.signature.
+    """
+    if inspect.ismethod(target):
+        return _plan(target.__func__)[1:]
+
+    try:
+        return _cached_plan(target)
+    except TypeError:
+        # Unhashable callables cannot be cached, so they are inspected on every call
+        return _cached_plan.__wrapped__(target)
+
+
+@lru_cache(maxsize=1024)
+def _cached_build_plan(constructor: Callable) -> tuple[tuple[tuple[inspect.Parameter, Any], ...], str | None]:
+    """
+    Get the parameters of a constructor that _build has to fill, inspecting each constructor only once.
+
+    Args:
+        constructor: The constructor to inspect.
+
+    Returns:
+        The plan without self, **kwargs and unannotated *args, and the name of an annotated *args parameter.
+    """
+    steps = []
+    variadic = None
+
+    for param, type_to_resolve in _plan(constructor):
+        if param.name == "self" or param.kind == param.VAR_KEYWORD:
+            continue
+
+        if param.kind == param.VAR_POSITIONAL:
+            if param.annotation is inspect.Parameter.empty:
+                continue
+            variadic = param.name
+
+        steps.append((param, type_to_resolve))
+
+    return tuple(steps), variadic
+
+
+def _build_plan(constructor: Callable) -> tuple[tuple[tuple[inspect.Parameter, Any], ...], str | None]:
+    """
+    Get the parameters of a constructor that _build has to fill.
+
+    Args:
+        constructor: The constructor to inspect.
+
+    Returns:
+        The plan without self, **kwargs and unannotated *args, and the name of an annotated *args parameter.
+
+    Raises:
+        ValueError: If no signature can be provided for the constructor.
+    """
+    try:
+        return _cached_build_plan(constructor)
+    except TypeError:
+        return _cached_build_plan.__wrapped__(constructor)
+
 
 class Container(ContainerContract):
     """
     Dependency injection container.
     """
 
+    # The container state lives in slots. The contracts define no slots, so instances keep a
+    # __dict__ and methods can still be patched per instance.
+    __slots__ = (
+        "_abstract_aliases",
+        "_abstract_strings",
+        "_after_resolving_callbacks",
+        "_aliases",
+        "_before_resolving_callbacks",
+        "_bindings",
+        "_contextual_bindings",
+        "_global_after_resolving_callbacks",
+        "_global_before_resolving_callbacks",
+        "_global_resolving_callbacks",
+        "_has_after_resolving_callbacks",
+        "_has_before_resolving_callbacks",
+        "_has_resolving_callbacks",
+        "_instances",
+        "_rebinding_callbacks",
+        "_resolved",
+        "_resolving_callbacks",
+        "_scoped_instances",
+        "environment_resolver",
+    )
+
     _instance = None
 
     def __init__(self):
@@ -24,7 +217,7 @@ class Container(ContainerContract):
         self._instances = {}
         self._aliases = {}
         self._abstract_aliases = {}
-        self._resolved = {}
+        self._resolved = set()
         self._scoped_instances = {}
         self._global_before_resolving_callbacks = []
         self._before_resolving_callbacks = {}
@@ -32,8 +225,12 @@ class Container(ContainerContract):
         self._resolving_callbacks = {}
         self._global_after_resolving_callbacks = []
         self._after_resolving_callbacks = {}
+        self._has_before_resolving_callbacks = False
+        self._has_resolving_callbacks = False
+        self._has_after_resolving_callbacks = False
         self._rebinding_callbacks = {}
         self._contextual_bindings = {}
+        self._abstract_strings = {}
         self.environment_resolver = None
 
     @classmethod
@@ -72,7 +269,15 @@ class Container(ContainerContract):
         Returns:
             String representation of the abstract type.
         """
-        return Str.class_to_string(abstract)
+        # String keys, by far the most common, pass through on an exact type check
+        if type(abstract) is str or not isinstance(abstract, type):
+            return abstract
+
+        # Format each class key once; the memo lives on the container, so flush() releases the classes
+        abstract_str = self._abstract_strings.get(abstract)
+        if abstract_str is None:
+            abstract_str = self._abstract_strings[abstract] = sys.intern(Str.class_to_string(abstract))
+        return abstract_str
 
     def bound(self, abstract) -> bool:
         """
@@ -85,11 +290,13 @@ class Container(ContainerContract):
             bool
         """
         abstract_str = self._normalize_abstract(abstract)
+
+        # Once the application has booted most lookups are for shared instances, so probe those first
         return (
-            abstract_str in self._bindings
-            or abstract_str in self._instances
+            abstract_str in self._instances
+            or abstract_str in self._bindings
             or abstract_str in self._scoped_instances
-            or self.is_alias(abstract_str)
+            or abstract_str in self._aliases
         )
 
     def has(self, id: str | T) -> bool:
@@ -135,10 +342,7 @@ class Container(ContainerContract):
         Returns:
             bool
         """
-        abstract_str = self._normalize_abstract(abstract)
-
-        if self.is_alias(abstract_str):
-            abstract_str = self.get_alias(abstract_str)
+        abstract_str = self.get_alias(self._normalize_abstract(abstract))
 
         return abstract_str in self._resolved or abstract_str in self._instances
 
@@ -195,49 +399,43 @@ class Container(ContainerContract):
         try:
             # Get constructor signature
             constructor = getattr(concrete, "__init__")
-            signature = inspect.signature(constructor)
+
+            # Classes without a constructor of their own have nothing to inject
+            if constructor is object.__init__:
+                return concrete()
+
+            plan, variadic = _build_plan(constructor)
         except (AttributeError, ValueError):
             # No constructor or not inspectable, just instantiate
             return concrete(**kwargs)
 
+        # Nothing to inject, so there is no need to look for contextual bindings
+        if not plan:
+            return concrete()
+
         dependencies = {}
         concrete_str = self._normalize_abstract(concrete)
 
-        for param in signature.parameters.values():
-            # Skip 'self' and variable keyword args
-            if param.name == "self" or param.kind == param.VAR_KEYWORD:
-                continue
-
+        for param, type_to_resolve in plan:
             # Handle variadic positional parameters with type annotations
             if param.kind == param.VAR_POSITIONAL:
-                if param.annotation is not inspect.Parameter.empty:
-                    type_to_resolve = param.annotation
-
-                    # Unwrap Optional[T] to T
-                    origin = get_origin(type_to_resolve)
-                    if origin is Union or origin is types.UnionType:
-                        args = get_args(type_to_resolve)
-                        non_none_args = [arg for arg in args if arg is not types.NoneType]
-                        if len(args) > len(non_none_args) and len(non_none_args) == 1:
-                            type_to_resolve = non_none_args[0]
-
-                    # Check for contextual binding by type
-                    contextual = self._get_contextual_concrete(concrete_str, type_to_resolve)
-                    if contextual is not None:
-                        if callable(contextual):
-                            result = contextual(self)
-                        else:
-                            result = contextual
-
-                        # If result is a list, resolve each item and add as variadic args
-                        if isinstance(result, list):
-                            for item in result:
-                                if inspect.isclass(item):
-                                    dependencies[param.name] = dependencies.get(param.name, [])
-                                    dependencies[param.name].append(self.make(item))
-                                else:
-                                    dependencies[param.name] = dependencies.get(param.name, [])
-                                    dependencies[param.name].append(item)
+                # Check for contextual binding by type
+                contextual = self._get_contextual_concrete(concrete_str, type_to_resolve)
+                if contextual is not None:
+                    if callable(contextual):
+                        result = contextual(self)
+                    else:
+                        result = contextual
+
+                    # If result is a list, resolve each item and add as variadic args
+                    if isinstance(result, list):
+                        for item in result:
+                            if inspect.isclass(item):
+                                dependencies[param.name] = dependencies.get(param.name, [])
+                                dependencies[param.name].append(self.make(item))
+                            else:
+                                dependencies[param.name] = dependencies.get(param.name, [])
+                                dependencies[param.name].append(item)
                 continue
 
             # If a value is already provided in kwargs, use it
@@ -256,16 +454,6 @@ class Container(ContainerContract):
 
             # Resolve from type hint
             if param.annotation is not inspect.Parameter.empty:
-                type_to_resolve = param.annotation
-
-                # Unwrap Optional[T] to T
-                origin = get_origin(type_to_resolve)
-                if origin is Union or origin is types.UnionType:
-                    args = get_args(type_to_resolve)
-                    non_none_args = [arg for arg in args if arg is not types.NoneType]
-                    if len(args) > len(non_none_args) and len(non_none_args) == 1:
-                        type_to_resolve = non_none_args[0]
-
                 # Check for contextual binding by type
                 contextual = self._get_contextual_concrete(concrete_str, type_to_resolve)
                 if contextual is not None:
@@ -309,31 +497,27 @@ class Container(ContainerContract):
         # Handle variadic arguments - unpack lists into *args
         variadic_args = []
         positional_params = []
-        for key, value in list(dependencies.items()):
-            if isinstance(value, list) and key in [
-                p.name for p in signature.parameters.values() if p.kind == inspect.Parameter.VAR_POSITIONAL
-            ]:
-                variadic_args.extend(value)
-                del dependencies[key]
+        if variadic is not None and isinstance(dependencies.get(variadic), list):
+            variadic_args.extend(dependencies.pop(variadic))
 
         # Separate positional arguments that come before variadic args
         if variadic_args:
-            for param in signature.parameters.values():
+            for param, _ in plan:
                 if param.kind == inspect.Parameter.VAR_POSITIONAL:
                     break
-                if param.name in dependencies and param.name != "self":
+                if param.name in dependencies:
                     positional_params.append(dependencies[param.name])
                     del dependencies[param.name]
 
             return concrete(*positional_params, *variadic_args, **dependencies)
         return concrete(**dependencies)
 
-    def _fire_callback_array(self, callbacks: list, *args) -> None:
+    def _fire_callback_array(self, callbacks: list | tuple, *args) -> None:
         """
         Fire an array of callbacks with the given arguments.
 
         Args:
-            callbacks: List of callbacks to execute.
+            callbacks: Callbacks to execute.
             *args: Arguments to pass to each callback.
 
         Returns:
@@ -355,16 +539,19 @@ class Container(ContainerContract):
         """
         self._fire_callback_array(self._global_resolving_callbacks, instance, self)
 
-        if abstract in self._resolving_callbacks:
-            self._fire_callback_array(self._resolving_callbacks[abstract], instance, self)
+        callbacks = self._resolving_callbacks.get(abstract)
+        if callbacks:
+            self._fire_callback_array(callbacks, instance, self)
 
         # Fire callbacks for the concrete class and parent classes/interfaces
         if hasattr(instance, "__class__"):
             for base in instance.__class__.__mro__:
                 base_str = self._normalize_abstract(base)
                 # Skip if we already fired for this abstract
-                if base_str != abstract and base_str in self._resolving_callbacks:
-                    self._fire_callback_array(self._resolving_callbacks[base_str], instance, self)
+                if base_str != abstract:
+                    callbacks = self._resolving_callbacks.get(base_str)
+                    if callbacks:
+                        self._fire_callback_array(callbacks, instance, self)
 
     def _fire_after_resolving_callbacks(self, abstract: str, instance: Any) -> None:
         """
@@ -379,8 +566,9 @@ class Container(ContainerContract):
         """
         self._fire_callback_array(self._global_after_resolving_callbacks, instance, self)
 
-        if abstract in self._after_resolving_callbacks:
-            self._fire_callback_array(self._after_resolving_callbacks[abstract], instance, self)
+        callbacks = self._after_resolving_callbacks.get(abstract)
+        if callbacks:
+            self._fire_callback_array(callbacks, instance, self)
 
     def _fire_rebinding_callbacks(self, abstract: str) -> None:
         """
@@ -392,8 +580,9 @@ class Container(ContainerContract):
         Returns:
             None
         """
-        if abstract in self._rebinding_callbacks:
-            self._fire_callback_array(self._rebinding_callbacks[abstract], abstract, self)
+        callbacks = self._rebinding_callbacks.get(abstract)
+        if callbacks:
+            self._fire_callback_array(callbacks, abstract, self)
 
     def _fire_before_resolving_callbacks(self, abstract: str, **kwargs) -> None:
         """
@@ -408,8 +597,9 @@ class Container(ContainerContract):
         """
         self._fire_callback_array(self._global_before_resolving_callbacks, abstract, kwargs, self)
 
-        if abstract in self._before_resolving_callbacks:
-            self._fire_callback_array(self._before_resolving_callbacks[abstract], abstract, kwargs, self)
+        callbacks = self._before_resolving_callbacks.get(abstract)
+        if callbacks:
+            self._fire_callback_array(callbacks, abstract, kwargs, self)
 
     def resolve(self, abstract, raise_events=True, **kwargs) -> T | Any:
         """
@@ -426,15 +616,16 @@ class Container(ContainerContract):
         abstract_str = self._normalize_abstract(abstract)
         abstract_str = self.get_alias(abstract_str)
 
-        if raise_events:
+        if raise_events and self._has_before_resolving_callbacks:
             self._fire_before_resolving_callbacks(abstract_str, **kwargs)
 
         # If an instance already exists and we're not passing parameters, return it.
-        if not kwargs and abstract_str in self._scoped_instances:
-            return self._scoped_instances[abstract_str]
-
-        if not kwargs and abstract_str in self._instances:
-            return self._instances[abstract_str]
+        if not kwargs:
+            instance = self._scoped_instances.get(abstract_str, _MISSING)
+            if instance is _MISSING:
+                instance = self._instances.get(abstract_str, _MISSING)
+            if instance is not _MISSING:
+                return instance
 
         binding = self._bindings.get(abstract_str)
 
@@ -449,26 +640,38 @@ class Container(ContainerContract):
 
         # We're ready to build an instance of the concrete implementation.
         if callable(concrete):
-            instance = self._build(concrete, **kwargs)
+            resolving = _resolving.get()
+            key = (id(self), abstract_str)
+            if key in resolving:
+                raise CircularDependencyException(f"Circular dependency detected while resolving [{abstract_str}].")
+
+            token = _resolving.set(resolving | {key})
+            try:
+                instance = self._build(concrete, **kwargs)
+            finally:
+                _resolving.reset(token)
         else:
             instance = concrete
 
-        # If the binding is scoped, cache the instance so it can be reused within the same scope.
-        if not kwargs and self.is_scoped(abstract_str):
-            self._scoped_instances[abstract_str] = instance
+        # The binding fetched above already carries the lifetime flags, so there is no need
+        # to look it up again through is_scoped() and is_shared().
+        if not kwargs and binding:
+            # If the binding is scoped, cache the instance so it can be reused within the same scope.
+            if binding["scoped"]:
+                self._scoped_instances[abstract_str] = instance
 
-        # If the binding is shared and we're not passing parameters, cache the instance.
-        if not kwargs and self.is_shared(abstract_str):
-            self._instances[abstract_str] = instance
+            # If the binding is shared and we're not passing parameters, cache the instance.
+            if binding["shared"]:
+                self._instances[abstract_str] = instance
 
-        self._resolved[abstract_str] = True
+        self._resolved.add(abstract_str)
 
         # Fire resolving callbacks
-        if raise_events:
+        if raise_events and self._has_resolving_callbacks:
             self._fire_resolving_callbacks(abstract_str, instance)
 
         # Fire after resolving callbacks
-        if raise_events:
+        if raise_events and self._has_after_resolving_callbacks:
             self._fire_after_resolving_callbacks(abstract_str, instance)
 
         return instance
@@ -566,7 +769,7 @@ class Container(ContainerContract):
         if callable(abstract) and not inspect.isclass(abstract):
             return self._bind_based_on_closure_return_types(abstract, concrete, shared, scoped)
 
-        abstract_str = self._normalize_abstract(abstract)
+        abstract_str = _intern_key(self._normalize_abstract(abstract))
 
         self._drop_stale_instances(abstract_str)
 
@@ -645,7 +848,11 @@ class Container(ContainerContract):
             bool
         """
         abstract_str = self._normalize_abstract(abstract)
-        return abstract_str in self._instances or self._bindings.get(abstract_str, {}).get("shared", False)
+        if abstract_str in self._instances:
+            return True
+
+        binding = self._bindings.get(abstract_str)
+        return binding is not None and binding["shared"]
 
     def is_scoped(self, abstract) -> bool:
         """
@@ -658,7 +865,11 @@ class Container(ContainerContract):
             bool
         """
         abstract_str = self._normalize_abstract(abstract)
-        return abstract_str in self._scoped_instances or self._bindings.get(abstract_str, {}).get("scoped", False)
+        if abstract_str in self._scoped_instances:
+            return True
+
+        binding = self._bindings.get(abstract_str)
+        return binding is not None and binding["scoped"]
 
     def instance(self, abstract, instance: T) -> T:
         """
@@ -671,7 +882,7 @@ class Container(ContainerContract):
         Returns:
             The registered instance.
         """
-        abstract_str = self._normalize_abstract(abstract)
+        abstract_str = _intern_key(self._normalize_abstract(abstract))
 
         # Remove any existing alias
         if abstract_str in self._aliases:
@@ -690,8 +901,8 @@ class Container(ContainerContract):
             abstract: Abstract type identifier.
             alias: Alias name.
         """
-        abstract_str = self._normalize_abstract(abstract)
-        alias_str = self._normalize_abstract(alias)
+        abstract_str = _intern_key(self._normalize_abstract(abstract))
+        alias_str = _intern_key(self._normalize_abstract(alias))
 
         if alias_str == abstract_str:
             raise ValueError(f"[{alias_str}] is aliased to itself.")
@@ -724,9 +935,11 @@ class Container(ContainerContract):
         Returns:
             The resolved alias or the original abstract if no alias exists.
         """
-        if abstract in self._aliases:
-            return self.get_alias(self._aliases[abstract])
-        return abstract
+        # A single probe both tests for an alias and fetches its target
+        target = self._aliases.get(abstract)
+        if target is None:
+            return abstract
+        return self.get_alias(target)
 
     def flush(self) -> None:
         """
@@ -734,11 +947,12 @@ class Container(ContainerContract):
         """
         self._aliases = {}
         self._abstract_aliases = {}
-        self._resolved = {}
+        self._resolved = set()
         self._bindings = {}
         self._instances = {}
         self._scoped_instances = {}
         self._contextual_bindings = {}
+        self._abstract_strings = {}
 
     def _get_method_dependencies(self, callback: Callable, parameters: dict[str, Any]) -> dict[str, Any]:
         """
@@ -754,7 +968,7 @@ class Container(ContainerContract):
         dependencies = parameters.copy()
 
         try:
-            signature = inspect.signature(callback)
+            plan = _plan(callback)
         except (ValueError, TypeError):
             return dependencies
 
@@ -763,7 +977,7 @@ class Container(ContainerContract):
         if hasattr(callback, "__self__"):
             concrete_str = self._normalize_abstract(callback.__self__.__class__)
 
-        for param in signature.parameters.values():
+        for param, type_to_resolve in plan:
             # Skip if already provided
             if param.name in dependencies:
                 continue
@@ -774,16 +988,6 @@ class Container(ContainerContract):
 
             # Resolve from type hint
             if param.annotation is not inspect.Parameter.empty:
-                type_to_resolve = param.annotation
-
-                # Unwrap Optional[T] to T
-                origin = get_origin(type_to_resolve)
-                if origin is Union or origin is types.UnionType:
-                    args = get_args(type_to_resolve)
-                    non_none_args = [arg for arg in args if arg is not types.NoneType]
-                    if len(args) > len(non_none_args) and len(non_none_args) == 1:
-                        type_to_resolve = non_none_args[0]
-
                 # Check for contextual binding if we have a concrete context
                 if concrete_str is not None:
                     contextual = self._get_contextual_concrete(concrete_str, type_to_resolve)
@@ -868,6 +1072,8 @@ class Container(ContainerContract):
         Returns:
             None
         """
+        self._has_before_resolving_callbacks = True
+
         # If abstract is a callable and no callback provided, it's a global callback
         if callable(abstract) and callback is None:
             self._global_before_resolving_callbacks.append(abstract)
@@ -880,9 +1086,10 @@ class Container(ContainerContract):
                 abstract_str = self._normalize_abstract(abstract)
 
             # Store callback for specific abstract type
-            if abstract_str not in self._before_resolving_callbacks:
-                self._before_resolving_callbacks[abstract_str] = []
-            self._before_resolving_callbacks[abstract_str].append(callback)
+            self._before_resolving_callbacks[abstract_str] = (
+                *self._before_resolving_callbacks.get(abstract_str, ()),
+                callback,
+            )
 
     def resolving(self, abstract, callback: Callable | None = None) -> None:
         """
@@ -895,6 +1102,8 @@ class Container(ContainerContract):
         Returns:
             None
         """
+        self._has_resolving_callbacks = True
+
         # If abstract is a callable and no callback provided, it's a global callback
         if callable(abstract) and callback is None:
             self._global_resolving_callbacks.append(abstract)
@@ -907,9 +1116,7 @@ class Container(ContainerContract):
                 abstract_str = self._normalize_abstract(abstract)
 
             # Store callback for specific abstract type
-            if abstract_str not in self._resolving_callbacks:
-                self._resolving_callbacks[abstract_str] = []
-            self._resolving_callbacks[abstract_str].append(callback)
+            self._resolving_callbacks[abstract_str] = (*self._resolving_callbacks.get(abstract_str, ()), callback)
 
     def after_resolving(self, abstract, callback: Callable | None = None) -> None:
         """
@@ -922,6 +1129,8 @@ class Container(ContainerContract):
         Returns:
             None
         """
+        self._has_after_resolving_callbacks = True
+
         # If abstract is a callable and no callback provided, it's a global callback
         if callable(abstract) and callback is None:
             self._global_after_resolving_callbacks.append(abstract)
@@ -934,9 +1143,10 @@ class Container(ContainerContract):
                 abstract_str = self._normalize_abstract(abstract)
 
             # Store callback for specific abstract type
-            if abstract_str not in self._after_resolving_callbacks:
-                self._after_resolving_callbacks[abstract_str] = []
-            self._after_resolving_callbacks[abstract_str].append(callback)
+            self._after_resolving_callbacks[abstract_str] = (
+                *self._after_resolving_callbacks.get(abstract_str, ()),
+                callback,
+            )
 
     def rebinding(self, abstract, callback: Callable) -> None:
         """
@@ -952,9 +1162,7 @@ class Container(ContainerContract):
         abstract_str = self._normalize_abstract(abstract)
         abstract_str = self.get_alias(abstract_str)
 
-        if abstract_str not in self._rebinding_callbacks:
-            self._rebinding_callbacks[abstract_str] = []
-        self._rebinding_callbacks[abstract_str].append(callback)
+        self._rebinding_callbacks[abstract_str] = (*self._rebinding_callbacks.get(abstract_str, ()), callback)
 
     def factory(self, abstract) -> Callable:
         """
@@ -1089,12 +1297,9 @@ class Container(ContainerContract):
     def __delitem__(self, key: str) -> None:
         """Remove a binding from the container."""
         key_str = self._normalize_abstract(key)
-        if key_str in self._bindings:
-            del self._bindings[key_str]
-        if key_str in self._instances:
-            del self._instances[key_str]
-        if key_str in self._resolved:
-            del self._resolved[key_str]
+        self._bindings.pop(key_str, None)
+        self._instances.pop(key_str, None)
+        self._resolved.discard(key_str)
 
     def __contains__(self, key: str) -> bool:
         """Determine if a given type is bound in the container."""
@@ -1,18 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from elyx.events.listener_handle import ListenerHandle
 
 
 class Dispatcher(ABC):
     """Event dispatcher contract."""
 
     @abstractmethod
-    def listen(self, events: str | list[str] | Callable, listener: str | Callable | None = None) -> None:
+    def listen(self, events: str | list[str] | Callable, listener: str | Callable | None = None) -> ListenerHandle:
         """
         Register an event listener with the dispatcher.
 
         Args:
             events: Event name(s) or closure.
             listener: Listener callable or class name.
+
+        Returns:
+            Handle that can detach the registered listener.
         """
         pass
 
@@ -54,7 +60,9 @@ class Dispatcher(ABC):
         pass
 
     @abstractmethod
-    async def dispatch(self, event: str | object, payload: Any = None, halt: bool = False) -> list[Any] | None:
+    async def dispatch(
+        self, event: str | object, payload: Any = None, halt: bool = False, concurrent: bool = False
+    ) -> list[Any] | None:
         """
         Dispatch an event and call the listeners.
 
@@ -62,6 +70,7 @@ class Dispatcher(ABC):
             event: Event name or object.
             payload: Event payload.
             halt: Whether to halt on first non-null response.
+            concurrent: Whether to await the async listeners together instead of one by one.
 
         Returns:
             Array of responses or None if halted.
@@ -69,13 +78,29 @@ class Dispatcher(ABC):
         pass
 
     @abstractmethod
-    def push(self, event: str, payload: list[Any] | None = None) -> None:
+    def dispatch_sync(self, event: str | object, payload: Any = None, halt: bool = False) -> list[Any] | None:
+        """
+        Dispatch an event to synchronous listeners without going through the event loop.
+
+        Args:
+            event: Event name or object.
+            payload: Event payload.
+            halt: Whether to halt on first non-null response.
+
+        Returns:
+            Array of responses or None if halted.
+        """
+        pass
+
+    @abstractmethod
+    def push(self, event: str, payload: list[Any] | None = None, coalesce: bool = False) -> None:
         """
         Register an event and payload to be fired later.
 
         Args:
             event: Event name.
             payload: Event payload.
+            coalesce: Whether to replace the last queued payload of the event instead of queueing another one.
         """
         pass
 
@@ -90,12 +115,13 @@ class Dispatcher(ABC):
         pass
 
     @abstractmethod
-    def forget(self, event: str) -> None:
+    def forget(self, event: str | type, listener: str | list | Callable | None = None) -> None:
         """
         Remove a set of listeners from the dispatcher.
 
         Args:
-            event: Event name.
+            event: Event name or class.
+            listener: Only remove this listener, rather than every listener of the event.
         """
         pass
 
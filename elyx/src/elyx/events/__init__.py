@@ -7,16 +7,19 @@ from elyx._import_utils import import_attr
 if TYPE_CHECKING:
     from elyx.events.dispatcher import Dispatcher
     from elyx.events.event_service_provider import EventServiceProvider
+    from elyx.events.listener_handle import ListenerHandle
 
 __all__ = (
     "Dispatcher",
     "EventServiceProvider",
+    "ListenerHandle",
 )
 
 _dynamic_imports = {
     # keep-sorted start
     "Dispatcher": "dispatcher",
     "EventServiceProvider": "event_service_provider",
+    "ListenerHandle": "listener_handle",
     # keep-sorted end
 }
 
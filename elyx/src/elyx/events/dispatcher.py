@@ -1,15 +1,69 @@
+import asyncio
+import functools
 import inspect
 import re
+import sys
+from collections import deque
+from contextvars import ContextVar
+from types import CoroutineType
 from typing import Any, Callable, TypeVar
 
 from elyx.collections import Arr, Collection
 from elyx.container import Container
 from elyx.contracts.container import Container as ContainerContract
 from elyx.contracts.events import Dispatcher as DispatcherContract
+from elyx.events.listener_handle import ListenerHandle
 from elyx.support import ReflectsClosures, Str
 
 T = TypeVar("T")
 
+# Shared, immutable result for lookups that find no listeners
+_EMPTY: tuple = ()
+
+# The most event names whose listener records are cached; distinct names matching a wildcard could grow it forever
+_LISTENERS_CACHE_SIZE = 1024
+
+
+class _DeferFrame:
+    """The events one defer() call is collecting for the dispatcher that opened it."""
+
+    __slots__ = ("deferred", "dispatcher", "events", "open")
+
+    def __init__(self, dispatcher: Any, events: frozenset[str] | None):
+        self.dispatcher = dispatcher
+        self.deferred = deque()
+        self.events = events
+        self.open = True
+
+
+# The defer() frames of the running context, innermost last. Tasks copy the context when they are created, so a
+# task spawned inside a defer() callback still sees its frame after it closed; closed frames are therefore skipped.
+_defer_frames: ContextVar[tuple[_DeferFrame, ...]] = ContextVar("elyx_defer_frames", default=())
+
+
+class _Listener:
+    """A registered listener with its call adapter prepared at registration time."""
+
+    __slots__ = ("adapter", "is_async", "is_wildcard", "listener", "token")
+
+    def __init__(self, token: int, listener: Any, adapter: Callable, is_async: bool, is_wildcard: bool):
+        self.token = token
+        self.listener = listener
+        self.adapter = adapter
+        self.is_async = is_async
+        self.is_wildcard = is_wildcard
+
+
+class _PendingResponse:
+    """The coroutine a synchronous listener run was handed, with the responses collected before it."""
+
+    __slots__ = ("coroutine", "index", "responses")
+
+    def __init__(self, index: int, coroutine: CoroutineType, responses: list[Any]):
+        self.index = index
+        self.coroutine = coroutine
+        self.responses = responses
+
 
 class Dispatcher(ReflectsClosures, DispatcherContract):
     def __init__(self, container: ContainerContract | None = None):
@@ -17,18 +71,137 @@ class Dispatcher(ReflectsClosures, DispatcherContract):
             container = Container()
         self.container = container
 
-        # The registered event listeners: {event_name: [listener1, listener2, ...]}
+        # The registered event listeners, in registration order: {event_name: {token: _Listener}}
         self.listeners = {}
 
-        # The wildcard listeners: {pattern: [listener1, listener2, ...]}
+        # The wildcard listeners, in registration order: {pattern: {token: _Listener}}
         self.wildcards = {}
 
-        # Event deferring state
-        self.deferring_events = False
-        self.deferred_events = []
-        self.events_to_defer = None
+        # The wildcard lookup structures, rebuilt lazily after the wildcards change:
+        # (namespace trie, matcher for the remaining patterns, remaining patterns, registration positions)
+        self.wildcards_index = None
+
+        # The merged exact and wildcard listener records of recently dispatched events that have listeners:
+        # {event_name: (_Listener, ...)}
+        # A dispatch iterates its own tuple, so listeners registered meanwhile only fire on the next dispatch
+        self.listeners_cache = {}
+
+        # The cached event names with at least one listener that may return an awaitable
+        self.async_events = set()
+
+        # The listener records per dispatched event class, including those of its base classes: {type: (_Listener, ...)}
+        self.class_listeners_cache = {}
+
+        # The parsed class listener strings: {"Class:method": (class_name, method)}
+        self.parsed_listeners = {}
+
+        # The last token handed out to a listener registration
+        self.listener_token = 0
+
+        # The queued payloads awaiting a flush: {event_name: deque([payload1, payload2, ...])}
+        self.pushed = {}
+
+    def _event_key(self, event: str | type | object) -> str:
+        """
+        Normalize an event name or class to the key listeners are stored under.
+
+        Keys are interned so the listener lookups on every dispatch hit the identity fast path.
+        A class key is also stored on the class itself, so later dispatches skip formatting it.
+
+        Args:
+            event: Event name, class or object. An object is keyed by its class, as when it is dispatched.
+
+        Returns:
+            The event key.
+        """
+        if type(event) is str:
+            return sys.intern(event)
+
+        if isinstance(event, str):
+            # str subclasses such as StrEnum members cannot be interned, so they are keyed by their plain value
+            return sys.intern(str.__str__(event))
+
+        if not isinstance(event, type):
+            event = type(event)
+
+        # Read the class's own namespace so a subclass never picks up its parent's key
+        key = event.__dict__.get("_elyx_event_key")
+        if key is None:
+            key = sys.intern(Str.class_to_string(event))
+            try:
+                setattr(event, "_elyx_event_key", key)
+            except (AttributeError, TypeError):
+                # Built-in and extension types do not accept new attributes
+                pass
+        return key
+
+    def _flush_listeners_cache(self, event: str) -> None:
+        """
+        Drop the cached listener records affected by a change to the given event.
+
+        A wildcard may match any cached event name, so it flushes the whole cache.
+
+        Args:
+            event: The event key or wildcard pattern that changed.
+        """
+        if "*" in event:
+            self.listeners_cache.clear()
+            self.async_events.clear()
+            self.wildcards_index = None
+        else:
+            self.listeners_cache.pop(event, None)
+            self.async_events.discard(event)
+
+        # Any event key may be the base class of a cached event class
+        self.class_listeners_cache.clear()
+
+    def _listener_is_async(self, listener) -> bool:
+        """
+        Determine if a listener is known to hand back an awaitable.
+
+        Coroutine functions, and partials or callable objects wrapping them, are recognised up front so
+        their events go straight to the awaiting path. Any other listener may still return a coroutine,
+        such as a lambda calling an async function, so every response is checked at dispatch time.
+
+        Args:
+            listener: Listener callable or class name.
+
+        Returns:
+            True if the listener response may need to be awaited, False otherwise.
+        """
+        if inspect.isfunction(listener) or inspect.ismethod(listener) or isinstance(listener, functools.partial):
+            return inspect.iscoroutinefunction(listener)
+
+        if inspect.isbuiltin(listener):
+            return False
+
+        # A callable object is exactly as async as the __call__ method its class defines
+        call = getattr(type(listener), "__call__", None)
+        if inspect.isfunction(call):
+            return inspect.iscoroutinefunction(call)
+        return True
+
+    def _make_listener_record(self, listener, wildcard: bool = False) -> _Listener:
+        """
+        Build the stored record for a listener, adapting its call convention once at registration.
+
+        Args:
+            listener: Listener callable or class name.
+            wildcard: Whether this is a wildcard listener.
 
-    def _setup_wildcard_listen(self, event: str, listener) -> None:
+        Returns:
+            The listener record.
+        """
+        self.listener_token += 1
+        return _Listener(
+            self.listener_token,
+            listener,
+            self.make_listener(listener, wildcard),
+            self._listener_is_async(listener),
+            wildcard,
+        )
+
+    def _setup_wildcard_listen(self, event: str, listener) -> int:
         """
         Setup a wildcard listener callback.
 
@@ -37,91 +210,236 @@ class Dispatcher(ReflectsClosures, DispatcherContract):
             listener: Listener callable or class name.
 
         Returns:
-            None
+            The token the listener was registered under.
+        """
+        record = self._make_listener_record(listener, wildcard=True)
+        self.wildcards.setdefault(event, {})[record.token] = record
+        self._flush_listeners_cache(event)
+        return record.token
+
+    def _detach(self, event: str, token: int) -> None:
+        """
+        Remove a single listener registration from the dispatcher.
+
+        Args:
+            event: The event key the listener was registered under.
+            token: The token of the listener registration.
         """
-        if event not in self.wildcards:
-            self.wildcards[event] = []
-        self.wildcards[event].append(listener)
+        store = self.wildcards if "*" in event else self.listeners
+
+        records = store.get(event)
+        if records is None or records.pop(token, None) is None:
+            return
+
+        self._flush_listeners_cache(event)
+
+        if not records:
+            del store[event]
 
     def listen(
         self,
         events,
         listener=None,
-    ) -> None:
+    ) -> ListenerHandle:
         """
         Register an event listener with the dispatcher.
 
         Args:
             events: Event name(s), class type(s), or closure.
             listener: Listener callable or class name.
+
+        Returns:
+            Handle that can detach the registered listener.
         """
+        registrations = []
+
         # If events is a closure and no listener provided, extract event types from closure parameters
         if callable(events) and not isinstance(events, type) and listener is None:
+            handle = ListenerHandle(self._detach, registrations)
             try:
                 event_types = self._first_closure_parameter_types(events)
-                Collection(event_types).each(lambda event: self.listen(event, events))
-                return
+                Collection(event_types).each(lambda event: handle.extend(self.listen(event, events)))
             except RuntimeError:
                 # If we can't extract types, treat as wildcard listener
-                if "*" not in self.wildcards:
-                    self.wildcards["*"] = []
-                self.wildcards["*"].append(events)
-                return
+                registrations.append(("*", self._setup_wildcard_listen("*", events)))
+            return handle
 
         # Normalize events to list
-        if isinstance(events, str):
-            event_list = [events]
-        elif isinstance(events, type):
-            event_list = [Str.class_to_string(events)]
+        if isinstance(events, (str, type)):
+            event_list = [self._event_key(events)]
         elif isinstance(events, list):
-            event_list = []
-            for event in events:
-                if isinstance(event, type):
-                    event_list.append(Str.class_to_string(event))
-                else:
-                    event_list.append(event)
+            event_list = [self._event_key(event) for event in events]
         else:
-            return
+            return ListenerHandle(self._detach, registrations)
 
         # Register listener for each event
         for event in event_list:
             if "*" in event:
-                self._setup_wildcard_listen(event, listener)
+                registrations.append((event, self._setup_wildcard_listen(event, listener)))
             else:
-                if event not in self.listeners:
-                    self.listeners[event] = []
-                self.listeners[event].append(listener)
-        # Clear wildcard cache when adding new wildcard listeners
-        # TODO: Implement wildcard cache optimization
+                record = self._make_listener_record(listener)
+                self.listeners.setdefault(event, {})[record.token] = record
+                self._flush_listeners_cache(event)
+                registrations.append((event, record.token))
 
-    def has_listeners(self, event_name: str) -> bool:
+        return ListenerHandle(self._detach, registrations)
+
+    def _wildcard_index(self) -> tuple:
         """
-        Determine if a given event has listeners.
+        Get the lookup structures for the registered wildcard patterns.
+
+        Namespace patterns such as "order.*" go into a trie keyed by dotted segment, so they are
+        found by walking the event name instead of testing each pattern. Every other pattern becomes
+        an optional lookahead with its own capture group in a single regex, so one match reports all
+        of them at once.
+
+        Returns:
+            Tuple of (trie, matcher, matcher_patterns, positions).
+        """
+        if self.wildcards_index is None:
+            trie = {}
+            others = []
+
+            for pattern in self.wildcards:
+                prefix = pattern[:-2]
+                if pattern.endswith(".*") and "*" not in prefix:
+                    node = trie
+                    for segment in prefix.split("."):
+                        node = node.setdefault(segment, {})
+                    # The None key holds the patterns that end at this node
+                    node.setdefault(None, []).append(pattern)
+                else:
+                    others.append(pattern)
+
+            matcher = None
+            if others:
+                patterns = (re.escape(pattern).replace(r"\*", ".*") for pattern in others)
+                matcher = re.compile("".join(f"(?=({pattern}\\Z))?" for pattern in patterns), re.DOTALL)
+
+            positions = {pattern: position for position, pattern in enumerate(self.wildcards)}
+            self.wildcards_index = (trie, matcher, others, positions)
+
+        return self.wildcards_index
+
+    def _matching_wildcards(self, event_name: str) -> list[str]:
+        """
+        Get the wildcard patterns that match the given event name, in registration order.
 
         Args:
             event_name: The event name.
 
         Returns:
-            True if event has listeners, False otherwise.
+            List of matching wildcard patterns.
+        """
+        if not self.wildcards:
+            return []
+
+        trie, matcher, others, positions = self._wildcard_index()
+        matched = []
+
+        # A namespace pattern matches once its segments are consumed and at least one segment remains
+        node = trie
+        for segment in event_name.split(".")[:-1]:
+            node = node.get(segment)
+            if node is None:
+                break
+            matched.extend(node.get(None, ()))
+
+        if matcher is not None:
+            groups = matcher.match(event_name).groups()
+            matched.extend(pattern for pattern, group in zip(others, groups) if group is not None)
+
+        if len(matched) > 1:
+            matched.sort(key=positions.__getitem__)
+
+        return matched
+
+    def _prepare_listeners(self, event_name: str) -> tuple:
+        """
+        Prepare the listeners for a given event.
+
+        The records are copied into a tuple, so the snapshot is unaffected by later registrations.
+
+        Args:
+            event_name: The event name.
+
+        Returns:
+            Tuple of listener records.
+        """
+        listeners = self.listeners.get(event_name)
+        return tuple(listeners.values()) if listeners else _EMPTY
+
+    def _get_wildcard_listeners(self, event_name: str) -> tuple:
+        """
+        Get the wildcard listeners for the event.
+
+        Args:
+            event_name: The event name.
+
+        Returns:
+            Tuple of records for the wildcard listeners that match.
+        """
+        wildcard_listeners = _EMPTY
+        for pattern in self._matching_wildcards(event_name):
+            wildcard_listeners += tuple(self.wildcards[pattern].values())
+        return wildcard_listeners
+
+    def _get_listener_records(self, event_name: str) -> tuple:
+        """
+        Get the records for all of the listeners of a given event name.
+
+        Args:
+            event_name: The normalized event name.
+
+        Returns:
+            Tuple of listener records, or the shared empty tuple when there are none.
         """
-        return event_name in self.listeners or event_name in self.wildcards or self.has_wildcard_listeners(event_name)
+        records = self.listeners_cache.get(event_name)
+        if records is not None:
+            return records
+
+        listeners = self._prepare_listeners(event_name)
+        wildcard_listeners = self._get_wildcard_listeners(event_name)
+
+        if wildcard_listeners is _EMPTY:
+            records = listeners
+        elif listeners is _EMPTY:
+            records = wildcard_listeners
+        else:
+            records = listeners + wildcard_listeners
+
+        # Names without listeners are not cached, so probing unknown events never grows the cache
+        if records is _EMPTY:
+            return records
 
-    def _matches_wildcard(self, event_name: str, pattern: str) -> bool:
+        listeners_cache = self.listeners_cache
+        if len(listeners_cache) >= _LISTENERS_CACHE_SIZE:
+            # Evict the oldest entry; dicts keep insertion order
+            evicted = next(iter(listeners_cache))
+            del listeners_cache[evicted]
+            self.async_events.discard(evicted)
+
+        listeners_cache[event_name] = records
+        if any(record.is_async for record in records):
+            self.async_events.add(event_name)
+        return records
+
+    def has_listeners(self, event_name: str) -> bool:
         """
-        Check if an event name matches a wildcard pattern.
+        Determine if a given event has listeners.
 
         Args:
             event_name: The event name.
-            pattern: The wildcard pattern (e.g., "order.*" or "*").
 
         Returns:
-            True if matches, False otherwise.
+            True if event has listeners, False otherwise.
         """
-        if pattern == "*":
+        event_name = self._event_key(event_name)
+        if event_name in self.listeners or event_name in self.wildcards:
             return True
 
-        regex_pattern = pattern.replace(".", r"\.").replace("*", ".*")
-        return bool(re.match(f"^{regex_pattern}$", event_name))
+        # Answer wildcard matches from the per-event index that dispatch() shares
+        return self._get_listener_records(event_name) is not _EMPTY
 
     def has_wildcard_listeners(self, event_name: str) -> bool:
         """
@@ -133,10 +451,7 @@ class Dispatcher(ReflectsClosures, DispatcherContract):
         Returns:
             True if event has wildcard listeners, False otherwise.
         """
-        for key in self.wildcards.keys():
-            if Str.is_pattern(key, event_name):
-                return True
-        return False
+        return bool(self._matching_wildcards(event_name))
 
     def _resolve_subscriber(self, subscriber: object | type | str) -> object:
         """
@@ -152,25 +467,52 @@ class Dispatcher(ReflectsClosures, DispatcherContract):
             return self.container.make(subscriber)
         return subscriber
 
-    def push(self, event, payload=None) -> None:
+    def push(self, event, payload=None, coalesce: bool = False) -> None:
         """
         Register an event and payload to be fired later.
 
         Args:
             event: Event name.
             payload: Event payload.
+            coalesce: Whether to replace the last queued payload of the event instead of queueing another one.
         """
+        event = self._event_key(event)
+
+        # Look the queue up once; setdefault() would build a throwaway deque on every push
+        payloads = self.pushed.get(event)
+        if payloads is None:
+            self.pushed[event] = deque((payload,))
+        elif coalesce and payloads:
+            payloads[-1] = payload
+        else:
+            payloads.append(payload)
+
+    def _parse_class_callable(self, listener: str | list | type) -> tuple[str, str]:
+        """
+        Parse the class listener into class and method.
 
-        event = Str.class_to_string(event)
+        Args:
+            listener: Listener string in format 'Class:method', array [class-string, string], or class.
 
-        async def dispatch_pushed():
-            # Unpack the payload if it's a list, otherwise pass as-is
-            if isinstance(payload, list):
-                await self.dispatch(event, *payload)
-            else:
-                await self.dispatch(event, payload)
+        Returns:
+            Tuple of (class_name, method_name).
+        """
+        if isinstance(listener, str):
+            # The same listener string is often registered for many events, so parse each one only once
+            parsed = self.parsed_listeners.get(listener)
+            if parsed is None:
+                class_name, method = Str.parse_callback(listener, "handle")
+                parsed = self.parsed_listeners[listener] = (sys.intern(class_name), sys.intern(method or "handle"))
+            return parsed
+
+        if isinstance(listener, list):
+            class_name, method = listener
+        else:
+            # Convert class type to string representation
+            class_name, method = Str.class_to_string(listener), "handle"
 
-        self.listen(f"{event}_pushed", dispatch_pushed)
+        # Both names are looked up on every call, so intern them for identity-first dict hits
+        return sys.intern(class_name), sys.intern(method)
 
     async def subscribe(self, subscriber) -> None:
         """
@@ -184,43 +526,236 @@ class Dispatcher(ReflectsClosures, DispatcherContract):
         events = subscriber.subscribe(self)  # ty:ignore[unresolved-attribute]
 
         if isinstance(events, dict):
+            subscriber_class = Str.class_to_string(type(subscriber))
+
             for event, listeners in events.items():
                 for listener in Arr.wrap(listeners):
-                    if isinstance(listener, str) and hasattr(subscriber, listener):
-                        self.listen(event, getattr(subscriber, listener))
-                        continue
+                    if isinstance(listener, str):
+                        handler = getattr(subscriber, listener, None)
+                        if handler is not None:
+                            self.listen(event, handler)
+                            continue
+
+                        # Handlers on the subscriber's own class reuse the instance that was just resolved
+                        class_name, method = self._parse_class_callable(listener)
+                        handler = getattr(subscriber, method, None) if class_name == subscriber_class else None
+                        if handler is not None:
+                            self.listen(event, handler)
+                            continue
+
                     self.listen(event, listener)
 
+    def _defer_frame(self, event: str) -> _DeferFrame | None:
+        """
+        Get the defer() frame that should collect the given event.
+
+        Args:
+            event: Event name.
+
+        Returns:
+            The innermost open frame of this dispatcher when it defers the event, None otherwise.
+        """
+        for frame in reversed(_defer_frames.get()):
+            if frame.open and frame.dispatcher is self:
+                return frame if frame.events is None or event in frame.events else None
+
+        return None
+
+    def _call_listeners(self, event: str | object, payload: Any, listeners: tuple, halt: bool = False) -> Any:
+        """
+        Invoke a set of listeners without awaiting their responses.
+
+        A listener that was not known to be async may still hand back a coroutine. The run stops there
+        and returns a _PendingResponse, so the caller can await it before the remaining listeners run.
+
+        Args:
+            event: Event name or object.
+            payload: Event payload.
+            listeners: Tuple of listener records to invoke.
+            halt: Whether to halt on first non-null response.
+
+        Returns:
+            Array of responses; when halting, the first non-null response or None.
+        """
+        # Most events have a single listener, which needs neither the loop nor the incremental list
+        if len(listeners) == 1:
+            listener = listeners[0]
+            response = listener.adapter(event, payload if listener.is_wildcard else tuple(payload))
+            if type(response) is CoroutineType:
+                return _PendingResponse(0, response, [])
+            return response if halt else [response]
+
+        # Build the positional arguments once; only wildcard listeners take the payload list itself
+        args = tuple(payload)
+        responses = []
+
+        for index, listener in enumerate(listeners):
+            response = listener.adapter(event, payload if listener.is_wildcard else args)
+
+            # Coroutines cannot be subclassed, so an exact type check stands in for the isinstance() call
+            if type(response) is CoroutineType:
+                return _PendingResponse(index, response, responses)
+
+            if halt and response is not None:
+                return response
+
+            responses.append(response)
+
+            # If listener returns False, stop propagation
+            if response is False:
+                break
+
+        return None if halt else responses
+
+    async def _invoke_listeners(
+        self,
+        event: str | object,
+        payload: Any,
+        listeners: tuple,
+        halt: bool = False,
+        responses: list[Any] | None = None,
+    ) -> list[Any] | None:
+        """
+        Invoke a set of listeners.
+
+        Args:
+            event: Event name or object.
+            payload: Event payload.
+            listeners: Tuple of listener records to invoke.
+            halt: Whether to halt on first non-null response.
+            responses: The responses of listeners already invoked, which the new responses are appended to.
+
+        Returns:
+            Array of responses or None if halted.
+        """
+        # Build the positional arguments once; only wildcard listeners take the payload list itself
+        args = tuple(payload)
+        if responses is None:
+            responses = []
+
+        for listener in listeners:
+            # The adapter was built by make_listener at registration time
+            response = listener.adapter(event, payload if listener.is_wildcard else args)
+
+            # Coroutines cannot be subclassed, so an exact type check stands in for the isinstance() call
+            if type(response) is CoroutineType:
+                response = await response
+
+            # If halting and we got a non-null response, return it immediately
+            if halt and response is not None:
+                return response
+
+            # If listener returns False, stop propagation
+            if response is False:
+                responses.append(response)
+                break
+
+            responses.append(response)
+
+        return None if halt else responses
+
+    async def _resume_listeners(
+        self,
+        event_name: str,
+        event: str | object,
+        payload: Any,
+        listeners: tuple,
+        halt: bool,
+        pending: _PendingResponse,
+    ) -> Any:
+        """
+        Finish a synchronous listener run that was handed a coroutine.
+
+        The listener is flagged as async, so later dispatches of the event take the awaiting path directly.
+
+        Args:
+            event_name: The normalized event name.
+            event: Event name or object.
+            payload: Event payload.
+            listeners: Tuple of listener records being invoked.
+            halt: Whether to halt on first non-null response.
+            pending: Where the synchronous run stopped.
+
+        Returns:
+            Array of responses; when halting, the first non-null response or None.
+        """
+        listeners[pending.index].is_async = True
+        self.async_events.add(event_name)
+
+        response = await pending.coroutine
+        if halt and response is not None:
+            return response
+
+        responses = pending.responses
+        responses.append(response)
+
+        # If listener returns False, stop propagation
+        if response is False:
+            return None if halt else responses
+
+        return await self._invoke_listeners(event, payload, listeners[pending.index + 1 :], halt, responses)
+
     async def flush(self, event) -> None:
         """
         Flush a set of pushed events.
 
+        The listeners are resolved once when the flush starts and called for each queued payload in turn.
+
         Args:
             event: Event name.
         """
-        event = Str.class_to_string(event)
-        await self.dispatch(f"{event}_pushed")
+        event = self._event_key(event)
+
+        # Pop the queue up front so payloads pushed while flushing wait for the next flush
+        payloads = self.pushed.pop(event, None)
+        if payloads is None:
+            return
+
+        # Inside defer(), each payload is queued for replay exactly as dispatch() would queue it
+        if self._defer_frame(event) is not None:
+            while payloads:
+                await self.dispatch(event, payloads.popleft())
+            return
+
+        # Resolve the listeners once for the whole batch rather than once per payload
+        listeners = self._get_listener_records(event)
+        if listeners is _EMPTY:
+            return
+
+        while payloads:
+            payload = Arr.wrap(payloads.popleft())
+
+            if event in self.async_events:
+                await self._invoke_listeners(event, payload, listeners)
+                continue
+
+            result = self._call_listeners(event, payload, listeners)
+            if type(result) is _PendingResponse:
+                await self._resume_listeners(event, event, payload, listeners, False, result)
 
-    def forget(self, event: str) -> None:
+    def forget(self, event: str | type, listener: str | list | Callable | None = None) -> None:
         """
         Remove a set of listeners from the dispatcher.
 
         Args:
-            event: Event name.
+            event: Event name or class.
+            listener: Only remove this listener, rather than every listener of the event.
         """
-        if "*" in event:
-            if event in self.wildcards:
-                del self.wildcards[event]
-        else:
-            if event in self.listeners:
-                del self.listeners[event]
+        event = self._event_key(event)
+        store = self.wildcards if "*" in event else self.listeners
+
+        if listener is None:
+            self._flush_listeners_cache(event)
+            store.pop(event, None)
+            return
+
+        for record in list(store.get(event, {}).values()):
+            if record.listener == listener:
+                self._detach(event, record.token)
 
     def forget_pushed(self) -> None:
         """Forget all of the queued listeners."""
-        # Remove all listeners that end with '_pushed'
-        pushed_events = [key for key in self.listeners.keys() if key.endswith("_pushed")]
-        for event in pushed_events:
-            del self.listeners[event]
+        self.pushed.clear()
 
     async def until(self, event: str | object, payload: Any = None) -> Any:
         """
@@ -235,37 +770,17 @@ class Dispatcher(ReflectsClosures, DispatcherContract):
         """
         return await self.dispatch(event, payload, halt=True)
 
-    def _parse_class_callable(self, listener: str) -> tuple[str, str]:
-        """
-        Parse the class listener into class and method.
-
-        Args:
-            listener: Listener string in format 'Class:method'.
-
-        Returns:
-            Tuple of (class_name, method_name).
-        """
-        return Str.parse_callback(listener, "handle")
-
-    def _create_class_callable(self, listener: str | list) -> Callable:
+    def _create_class_callable(self, class_name: str, method: str) -> Callable:
         """
         Create a callable from a class-based listener.
 
         Args:
-            listener: Listener string or array [class-string, string].
+            class_name: The class to resolve from the container.
+            method: The listener method on the resolved instance.
 
         Returns:
             Callable that will invoke the listener method.
         """
-        if isinstance(listener, list):
-            class_name, method = listener
-        elif isinstance(listener, type):
-            # Convert class type to string representation
-            class_name = Str.class_to_string(listener)
-            method = "handle"
-        else:
-            class_name, method = self._parse_class_callable(listener)
-
         # Check if method exists, otherwise use __call__
         listener_instance = self.container.make(class_name)
         if not hasattr(listener_instance, method):
@@ -284,13 +799,20 @@ class Dispatcher(ReflectsClosures, DispatcherContract):
         Returns:
             Closure that will invoke the listener.
         """
+        # Parse the listener once; only the container resolution is left for each call
+        class_name, method = self._parse_class_callable(listener)
+
+        # The call convention is fixed per listener, so pick the wrapper once instead of branching per call
+        if wildcard:
 
-        def wrapper(event, payload):
-            callable_obj = self._create_class_callable(listener)
-            if wildcard:
-                return callable_obj(event, payload)
-            # Unpack payload for regular listeners
-            return callable_obj(*payload) if isinstance(payload, list) else callable_obj(payload)
+            def wildcard_wrapper(event, payload):
+                return self._create_class_callable(class_name, method)(event, payload)
+
+            return wildcard_wrapper
+
+        def wrapper(event, args):
+            # Regular listeners get the payload unpacked as positional arguments
+            return self._create_class_callable(class_name, method)(*args)
 
         return wrapper
 
@@ -303,7 +825,11 @@ class Dispatcher(ReflectsClosures, DispatcherContract):
             wildcard: Whether this is a wildcard listener.
 
         Returns:
-            Closure that will invoke the listener.
+            Closure taking (event, payload) that will invoke the listener; regular listeners
+            expect the payload as an argument sequence, ideally the tuple built by dispatch.
+
+        Raises:
+            TypeError: If the listener is neither callable nor a class listener.
         """
         if isinstance(listener, str):
             return self._create_class_listener(listener, wildcard)
@@ -314,17 +840,22 @@ class Dispatcher(ReflectsClosures, DispatcherContract):
         if isinstance(listener, type):
             return self._create_class_listener(listener, wildcard)
 
-        def wrapper(event, payload):
-            if wildcard:
-                return listener(event, payload)
-            # For regular listeners, unpack the payload array
-            return listener(*payload) if isinstance(payload, list) else listener(payload)
+        if not callable(listener):
+            raise TypeError(f"Event listener must be callable or a class listener, {type(listener).__name__} given.")
+
+        # Wildcard listeners already take (event, payload), so they need no wrapper at all
+        if wildcard:
+            return listener
+
+        def wrapper(event, args):
+            # For regular listeners, unpack the payload arguments
+            return listener(*args)
 
         return wrapper
 
-    def _prepare_listeners(self, event_name: str) -> list:
+    def get_listeners(self, event_name: str) -> list:
         """
-        Prepare the listeners for a given event.
+        Get all of the listeners for a given event name.
 
         Args:
             event_name: The event name.
@@ -332,100 +863,79 @@ class Dispatcher(ReflectsClosures, DispatcherContract):
         Returns:
             List of listeners.
         """
-        if event_name in self.listeners:
-            return [self.make_listener(listener) for listener in self.listeners[event_name]]
-        return []
-
-    def _get_wildcard_listeners(self, event_name: str) -> list:
-        """
-        Get the wildcard listeners for the event.
-
-        Args:
-            event_name: The event name.
+        return [record.adapter for record in self._get_listener_records(self._event_key(event_name))]
 
-        Returns:
-            List of wildcard listeners that match.
+    def _get_class_listener_records(self, event_class: type, event_name: str) -> tuple:
         """
-        wildcard_listeners = []
-        for pattern, listeners in self.wildcards.items():
-            if self._matches_wildcard(event_name, pattern):
-                wildcard_listeners.extend(listeners)
-        return wildcard_listeners
+        Get the records for all of the listeners of an event class, including those of its base classes.
 
-    def get_listeners(self, event_name: str) -> list:
-        """
-        Get all of the listeners for a given event name.
+        Listeners registered for a base class come after the event's own listeners, nearest base first.
 
         Args:
-            event_name: The event name.
+            event_class: The event class.
+            event_name: The normalized event name of the class.
 
         Returns:
-            List of listeners.
+            Tuple of listener records, or the shared empty tuple when there are none.
         """
-        listeners = []
-        listeners.extend(self._prepare_listeners(event_name))
+        records = self.class_listeners_cache.get(event_class)
+        if records is not None:
+            return records
 
-        # TODO: Add wildcard cache support
-        # listeners.extend(self.wildcards_cache.get(event_name, self._get_wildcard_listeners(event_name)))
-        listeners.extend(self._get_wildcard_listeners(event_name))
+        records = self._get_listener_records(event_name)
 
-        return listeners
+        # Every class ends its MRO with object, which never has listeners of its own
+        for base in event_class.__mro__[1:-1]:
+            inherited = self.listeners.get(self._event_key(base))
+            if inherited:
+                records += tuple(inherited.values())
+                if any(record.is_async for record in inherited.values()):
+                    self.async_events.add(event_name)
 
-    def _should_defer_event(self, event: str) -> bool:
-        """
-        Determine if the given event should be deferred.
-
-        Args:
-            event: Event name.
+        self.class_listeners_cache[event_class] = records
+        return records
 
-        Returns:
-            True if event should be deferred, False otherwise.
+    async def _gather_listeners(self, event: str | object, payload: Any, listeners: tuple) -> list[Any]:
         """
-        deferring_events = getattr(self, "deferring_events", False)
-        events_to_defer = getattr(self, "events_to_defer", None)
+        Invoke a set of listeners, awaiting their coroutines together.
 
-        return deferring_events and (events_to_defer is None or event in events_to_defer)
-
-    async def _invoke_listeners(
-        self, event: str | object, payload: Any, listeners: list, halt: bool = False
-    ) -> list[Any] | None:
-        """
-        Invoke a set of listeners.
+        Listeners are still called in order and a synchronous False response stops propagation,
+        but async listeners that were already started run to completion alongside each other.
 
         Args:
             event: Event name or object.
             payload: Event payload.
-            listeners: List of listeners to invoke.
-            halt: Whether to halt on first non-null response.
+            listeners: Tuple of listener records to invoke.
 
         Returns:
-            Array of responses or None if halted.
+            Array of responses, in listener order.
         """
+        # Build the positional arguments once; only wildcard listeners take the payload list itself
+        args = tuple(payload)
         responses = []
+        pending = []
 
         for listener in listeners:
-            # Call the listener directly (it's already wrapped by make_listener)
-            if inspect.iscoroutinefunction(listener):
-                response = await listener(event, payload)
-            else:
-                response = listener(event, payload)
+            response = listener.adapter(event, payload if listener.is_wildcard else args)
 
-            # If the result is a coroutine, await it
-            if inspect.iscoroutine(response):
-                response = await response
+            if type(response) is CoroutineType:
+                # Keep the slot so the awaited result lands in its registration position
+                pending.append((len(responses), response))
+                responses.append(None)
+                continue
 
-            # If halting and we got a non-null response, return it immediately
-            if halt and response is not None:
-                return response
+            responses.append(response)
 
             # If listener returns False, stop propagation
             if response is False:
-                responses.append(response)
                 break
 
-            responses.append(response)
+        if pending:
+            results = await asyncio.gather(*(coroutine for _, coroutine in pending))
+            for (index, _), result in zip(pending, results):
+                responses[index] = result
 
-        return None if halt else responses
+        return responses
 
     def _parse_event_and_payload(self, event, payload):
         """
@@ -441,35 +951,117 @@ class Dispatcher(ReflectsClosures, DispatcherContract):
         # If event is an object instance (not a string or type), wrap it as payload
         if not isinstance(event, (str, type)):
             payload = [event]
-            event = Str.class_to_string(type(event))
+            event = type(event)
 
-        return (event, Arr.wrap(payload))
+        return (self._event_key(event), Arr.wrap(payload))
 
-    async def dispatch(self, event, payload: Any = None, halt: bool = False) -> list[Any] | None:
+    def _prepare_dispatch(self, event, payload: Any, halt: bool, concurrent: bool) -> tuple | None:
         """
-        Dispatch an event and call the listeners.
+        Normalize an event for dispatching and look up its listeners.
 
         Args:
             event: Event name or object.
             payload: Event payload.
             halt: Whether to halt on first non-null response.
+            concurrent: Whether to await the async listeners together instead of one by one.
 
         Returns:
-            Array of responses or None if halted.
+            Tuple of (event_name, wrapped_payload, listener_records), or None when there is nothing to call.
         """
-        # Parse event and payload
-        event_name, payload = self._parse_event_and_payload(event, payload)
+        # Nothing can listen to the event, so skip normalizing the event and payload; string events only need
+        # their own entry checked, and only while no wildcard could match them and no defer() is collecting
+        if not self.wildcards and not _defer_frames.get():
+            if not self.listeners or (isinstance(event, str) and event not in self.listeners):
+                return None
+
+        # String events, the common case, need neither class reflection nor payload coercion
+        if isinstance(event, str):
+            event_class = None
+            event_name = sys.intern(event) if type(event) is str else self._event_key(event)
+            payload = Arr.wrap(payload)
+        else:
+            event_class = event if isinstance(event, type) else type(event)
+            event_name, payload = self._parse_event_and_payload(event, payload)
 
         # Check if we should defer this event
-        if self._should_defer_event(event_name):
-            self.deferred_events.append((event, payload, halt))
-            return None if halt else []
+        frame = self._defer_frame(event_name)
+        if frame is not None:
+            frame.deferred.append((event, payload, halt, concurrent))
+            return None
 
         # Get all listeners for this event
-        listeners = self.get_listeners(event_name)
+        if event_class is None:
+            listeners = self._get_listener_records(event_name)
+        else:
+            listeners = self._get_class_listener_records(event_class, event_name)
+
+        if listeners is _EMPTY:
+            return None
+
+        return event_name, payload, listeners
+
+    async def dispatch(
+        self, event, payload: Any = None, halt: bool = False, concurrent: bool = False
+    ) -> list[Any] | None:
+        """
+        Dispatch an event and call the listeners.
+
+        Args:
+            event: Event name or object.
+            payload: Event payload.
+            halt: Whether to halt on first non-null response.
+            concurrent: Whether to await the async listeners together instead of one by one.
+
+        Returns:
+            Array of responses or None if halted.
+        """
+        prepared = self._prepare_dispatch(event, payload, halt, concurrent)
+        if prepared is None:
+            return None if halt else []
+
+        event_name, payload, listeners = prepared
+
+        # Synchronous listener chains run inline, without awaiting a second coroutine
+        if event_name not in self.async_events:
+            result = self._call_listeners(event, payload, listeners, halt)
+            if type(result) is not _PendingResponse:
+                return result
+            return await self._resume_listeners(event_name, event, payload, listeners, halt, result)
+
+        if concurrent and not halt:
+            return await self._gather_listeners(event, payload, listeners)
 
         return await self._invoke_listeners(event, payload, listeners, halt)
 
+    def dispatch_sync(self, event, payload: Any = None, halt: bool = False) -> list[Any] | None:
+        """
+        Dispatch an event to synchronous listeners without going through the event loop.
+
+        Args:
+            event: Event name or object.
+            payload: Event payload.
+            halt: Whether to halt on first non-null response.
+
+        Returns:
+            Array of responses or None if halted.
+
+        Raises:
+            RuntimeError: If a listener returns a coroutine, which can only be awaited through dispatch().
+        """
+        prepared = self._prepare_dispatch(event, payload, halt, False)
+        if prepared is None:
+            return None if halt else []
+
+        event_name, payload, listeners = prepared
+        result = self._call_listeners(event, payload, listeners, halt)
+
+        # The run stops at the first listener that hands back a coroutine, which cannot be awaited here
+        if type(result) is _PendingResponse:
+            result.coroutine.close()
+            raise RuntimeError(f"Event [{event_name}] has async listeners; use dispatch() instead.")
+
+        return result
+
     async def defer(self, callback, events: list[str | type[T]] | None = None):
         """
         Execute the given callback while deferring events, then dispatch all deferred events.
@@ -481,31 +1073,24 @@ class Dispatcher(ReflectsClosures, DispatcherContract):
         Returns:
             Result of the callback.
         """
-
-        was_deferring = getattr(self, "deferring_events", False)
-        previous_deferred_events = getattr(self, "deferred_events", [])
-        previous_events_to_defer = getattr(self, "events_to_defer", None)
-
-        self.deferring_events = True
-        self.deferred_events = []
         # Normalize event types to strings
-        if events is not None:
-            self.events_to_defer = [
-                Str.class_to_string(event) if isinstance(event, type) else event for event in events
-            ]
-        else:
-            self.events_to_defer = None
+        events_to_defer = None if events is None else frozenset(self._event_key(event) for event in events)
+
+        frame = _DeferFrame(self, events_to_defer)
+        token = _defer_frames.set((*_defer_frames.get(), frame))
 
         try:
             result = await callback() if inspect.iscoroutinefunction(callback) else callback()
 
-            self.deferring_events = False
+            # Stop deferring in this frame so the replayed events, and any they raise, fire immediately
+            frame.events = frozenset()
 
-            for args in self.deferred_events:
-                await self.dispatch(*args)
+            while frame.deferred:
+                await self.dispatch(*frame.deferred.popleft())
 
             return result
         finally:
-            self.deferring_events = was_deferring
-            self.deferred_events = previous_deferred_events
-            self.events_to_defer = previous_events_to_defer
+            # Tasks spawned by the callback keep a reference to this frame; closing it lets their later
+            # dispatches fall through to an enclosing frame, or fire immediately
+            frame.open = False
+            _defer_frames.reset(token)
@@ -0,0 +1,40 @@
+from typing import Callable
+
+
+class ListenerHandle:
+    """Handle to the listener registrations made by a single listen() call."""
+
+    __slots__ = ("_detach", "_registrations")
+
+    def __init__(self, detach: Callable[[str, int], None], registrations: list[tuple[str, int]] | None = None):
+        """
+        Create a new listener handle.
+
+        Args:
+            detach: Callback removing a single (event_key, token) registration from the dispatcher.
+            registrations: The (event_key, token) pairs the listener was stored under.
+        """
+        self._detach = detach
+        self._registrations = [] if registrations is None else registrations
+
+    def extend(self, other: ListenerHandle) -> None:
+        """
+        Add the registrations of another handle, so detaching this handle removes them as well.
+
+        Args:
+            other: A handle returned by the same dispatcher.
+
+        Raises:
+            ValueError: If the other handle belongs to a different dispatcher.
+        """
+        if other._detach != self._detach:
+            raise ValueError("Listener handles of different dispatchers cannot be merged.")
+
+        self._registrations.extend(other._registrations)
+
+    def detach(self) -> None:
+        """Remove the listener from every event it was registered for."""
+        for event, token in self._registrations:
+            self._detach(event, token)
+
+        self._registrations = []
@@ -1,5 +1,9 @@
+import importlib
+import inspect
 import os
 import sys
+from collections import deque
+from functools import cache
 from pathlib import Path
 from typing import Any, Callable, Optional, Self, TypeVar
 
@@ -16,13 +20,53 @@ from elyx.support import Macroable, Str
 
 T = TypeVar("T")
 
+# Key of the container's own binding, formatted once instead of for every new application
+_CONTAINER_KEY = sys.intern(Str.class_to_string(Container))
+
+
+@cache
+def _bootstrapper_event(stage: str, bootstrapper: type | str) -> str:
+    """
+    Get the name of the event fired around a bootstrapper, formatted once per bootstrapper.
+
+    Args:
+        stage: Either "bootstrapping" or "bootstrapped".
+        bootstrapper: The bootstrapper class or class name.
+
+    Returns:
+        The event name, such as "bootstrapped: module.Bootstrapper".
+    """
+    return f"{stage}: {Str.class_to_string(bootstrapper)}"
+
+
+@cache
+def _provider_class(provider: str) -> type:
+    """
+    Import a service provider class from its dotted name, once per name.
+
+    Args:
+        provider: Dotted name of the provider class, such as "module.Provider".
+
+    Returns:
+        The service provider class.
+
+    Raises:
+        ValueError: If the name has no module part.
+    """
+    module_name, _, class_name = provider.rpartition(".")
+    if not module_name:
+        raise ValueError(f"Invalid class name format: '{provider}'")
+
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 class Application(Container, Macroable):
     def _register_base_bindings(self):
         """Register the basic bindings into the container."""
-        self.instance("app", self)
-        self.instance(Application, self)
-        self.instance(Container, self)
+        # Nothing is aliased yet, so the instances are stored directly under their precomputed keys
+        self._instances["app"] = self
+        self._instances[_APPLICATION_KEY] = self
+        self._instances[_CONTAINER_KEY] = self
 
     def _register_base_service_providers(self):
         """Register all of the base service providers."""
@@ -51,9 +95,9 @@ class Application(Container, Macroable):
         self._has_been_bootstrapped = False
         self._booted = False
         self._deferred_services = {}
-        self._booting_callbacks = []
-        self._booted_callbacks = []
-        self._terminating_callbacks = []
+        self._booting_callbacks = deque()
+        self._booted_callbacks = deque()
+        self._terminating_callbacks = deque()
         self._environment_path = None
         self._environment_file = ".env"
         self._is_running_in_console = None
@@ -67,6 +111,7 @@ class Application(Container, Macroable):
         helpers._app = self
 
         self._service_providers = {}
+        self._providers_by_type = {}
         self._register_base_bindings()
         self._register_base_service_providers()
         self._register_core_container_aliases()
@@ -147,13 +192,15 @@ class Application(Container, Macroable):
         if self.is_booted():
             return
 
-        # Fire booting callbacks
-        for callback in self._booting_callbacks:
-            callback(self)
+        # Drain the booting callbacks, including any registered by a booting callback while they run
+        booting_callbacks = self._booting_callbacks
+        while booting_callbacks:
+            booting_callbacks.popleft()(self)
 
-        # Fire booted callbacks
-        for callback in self._booted_callbacks:
-            callback(self)
+        # Drain the booted callbacks, including any registered by a booted callback while they run
+        booted_callbacks = self._booted_callbacks
+        while booted_callbacks:
+            booted_callbacks.popleft()(self)
 
         self._booted = True
 
@@ -196,8 +243,7 @@ class Application(Container, Macroable):
             bootstrapper: The bootstrapper class.
             callback: Callback to execute before bootstrapping.
         """
-        bootstrapper_name = self._normalize_abstract(bootstrapper)
-        self["events"].listen(f"bootstrapping: {bootstrapper_name}", callback)
+        self["events"].listen(_bootstrapper_event("bootstrapping", bootstrapper), callback)
 
     def after_loading_environment(self, callback: Callable) -> None:
         """
@@ -216,8 +262,7 @@ class Application(Container, Macroable):
             bootstrapper: The bootstrapper class.
             callback: Callback to execute after bootstrapping.
         """
-        bootstrapper_name = self._normalize_abstract(bootstrapper)
-        self["events"].listen(f"bootstrapped: {bootstrapper_name}", callback)
+        self["events"].listen(_bootstrapper_event("bootstrapped", bootstrapper), callback)
 
     def has_been_bootstrapped(self) -> bool:
         """
@@ -469,9 +514,21 @@ class Application(Container, Macroable):
         Args:
             provider: Service provider instance.
         """
-        name = self._normalize_abstract(provider)
+        # Providers are keyed by their class, so each class is registered at most once
+        name = self._normalize_abstract(type(provider))
+
+        # A forced re-registration replaces the earlier provider in the type index as well
+        previous = self._service_providers.get(name)
+        if previous is not None:
+            for cls in type(previous).__mro__[:-1]:
+                self._providers_by_type[self._normalize_abstract(cls)].remove(previous)
+
         self._service_providers[name] = provider
 
+        # Index the provider under each of its classes, so get_providers() is a lookup instead of a scan
+        for cls in type(provider).__mro__[:-1]:
+            self._providers_by_type.setdefault(self._normalize_abstract(cls), []).append(provider)
+
     def _boot_provider(self, provider: ServiceProvider) -> None:
         """
         Boot the given service provider.
@@ -479,8 +536,16 @@ class Application(Container, Macroable):
         Args:
             provider: Service provider instance to boot.
         """
-        if hasattr(provider, "boot") and callable(provider.boot):
-            self.call(provider.boot)
+        boot = getattr(provider, "boot", None)
+        if not callable(boot):
+            return
+
+        # A boot() without parameters has nothing to inject, so skip the container's signature inspection
+        code = getattr(boot, "__code__", None)
+        if code is not None and inspect.ismethod(boot) and code.co_argcount + code.co_kwonlyargcount == 1:
+            boot()
+        else:
+            self.call(boot)
 
     def register(self, provider, force: bool = False) -> ServiceProvider:
         """
@@ -492,24 +557,26 @@ class Application(Container, Macroable):
         if registered and not force:
             return registered
 
-        if isinstance(provider, str):
-            provider = self.resolve_provider(provider)
-
-        if isinstance(provider, type):
+        if isinstance(provider, (str, type)):
             provider = self.resolve_provider(provider)
 
-        if hasattr(provider, "register") and callable(provider.register):
-            provider.register()
+        register = getattr(provider, "register", None)
+        if callable(register):
+            register()
 
-        if hasattr(provider, "bindings"):
-            for key, value in provider.bindings.items():
-                self.bind(key, value)
+        bindings = getattr(provider, "bindings", None)
+        if bindings is not None:
+            bind = self.bind
+            for key, value in bindings.items():
+                bind(key, value)
 
-        if hasattr(provider, "singletons"):
-            for key, value in provider.singletons.items():
+        singletons = getattr(provider, "singletons", None)
+        if singletons is not None:
+            singleton = self.singleton
+            for key, value in singletons.items():
                 if isinstance(key, int):
                     key = value
-                self.singleton(key, value)
+                singleton(key, value)
 
         self._mark_as_registered(provider)
 
@@ -523,13 +590,30 @@ class Application(Container, Macroable):
         Get the registered service provider instance if it exists.
 
         Args:
-            provider: Service provider instance or class name.
+            provider: Service provider instance, class or class name.
 
         Returns:
             Service provider instance or None if not found.
         """
-        name = self._normalize_abstract(provider)
-        return self._service_providers.get(name)
+        if not isinstance(provider, (str, type)):
+            provider = type(provider)
+
+        return self._service_providers.get(self._normalize_abstract(provider))
+
+    def get_providers(self, provider) -> list:
+        """
+        Get the registered service provider instances if any exist.
+
+        Args:
+            provider: Service provider instance, class or class name.
+
+        Returns:
+            List of the registered providers that are instances of the given class.
+        """
+        if not isinstance(provider, (str, type)):
+            provider = type(provider)
+
+        return list(self._providers_by_type.get(self._normalize_abstract(provider), ()))
 
     def resolve_provider(self, provider):
         """
@@ -541,12 +625,17 @@ class Application(Container, Macroable):
         Returns:
             Service provider instance.
         """
+        if isinstance(provider, str):
+            provider = _provider_class(provider)
+
         return provider(self)
 
     def terminating(self, callback: Callable | str) -> Self:
         """
         Register a terminating callback with the application.
 
+        String references are stored as given and only imported and resolved when terminate() runs.
+
         Args:
             callback: Callable or string reference to execute on termination.
 
@@ -558,7 +647,8 @@ class Application(Container, Macroable):
 
     def terminate(self) -> None:
         """Terminate the application."""
-        for callback in self._terminating_callbacks:
+        # Iterate a snapshot, since a deque cannot be appended to while it is iterated
+        for callback in tuple(self._terminating_callbacks):
             self.call(callback)
 
     def get_deferred_services(self) -> dict:
@@ -617,9 +707,9 @@ class Application(Container, Macroable):
         super().flush()
 
         self._deferred_services = {}
-        self._booting_callbacks = []
-        self._booted_callbacks = []
-        self._terminating_callbacks = []
+        self._booting_callbacks.clear()
+        self._booted_callbacks.clear()
+        self._terminating_callbacks.clear()
 
     def load_deferred_providers(self) -> None:
         """Load and boot all of the remaining deferred providers."""
@@ -680,6 +770,18 @@ class Application(Container, Macroable):
         Returns:
             Resolved instance.
         """
+        # A shared instance under a plain string key is returned as is, unless an alias or a
+        # before resolving callback could change the outcome of the full resolution below
+        if not kwargs and type(abstract) is str:
+            instance = self._instances.get(abstract)
+            if (
+                instance is not None
+                and abstract not in self._aliases
+                and abstract not in self._scoped_instances
+                and not self._has_before_resolving_callbacks
+            ):
+                return instance
+
         abstract_str = self._normalize_abstract(abstract)
         abstract_str = self.get_alias(abstract_str)
         self._load_deferred_provider_if_needed(abstract_str)
@@ -714,4 +816,8 @@ class Application(Container, Macroable):
             bool
         """
         abstract_str = self._normalize_abstract(abstract)
-        return self.is_deferred_service(abstract_str) or super().bound(abstract)
+        return super().bound(abstract_str) or abstract_str in self._deferred_services
+
+
+# Key of the application's own binding; the class has to exist before it can be formatted
+_APPLICATION_KEY = sys.intern(Str.class_to_string(Application))
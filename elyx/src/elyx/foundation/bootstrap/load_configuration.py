@@ -1,3 +1,5 @@
+from functools import lru_cache
+from types import CodeType, ModuleType
 from typing import TYPE_CHECKING
 
 from elyx.config import Repository
@@ -9,6 +11,24 @@ if TYPE_CHECKING:
     from elyx.foundation import Application
 
 
+@lru_cache(maxsize=64)
+def _compile_configuration_file(path: str, mtime_ns: int) -> CodeType:
+    """
+    Read and compile a configuration file.
+
+    The modification time is part of the cache key, so an edited file is compiled again.
+
+    Args:
+        path: The path to the configuration file.
+        mtime_ns: The modification time of the file, in nanoseconds.
+
+    Returns:
+        The compiled code of the file.
+    """
+    with open(path, "rb") as file:
+        return compile(file.read(), path, "exec")
+
+
 class LoadConfiguration(Bootstrapper):
     """Bootstrap class for loading configuration files from the config directory."""
 
@@ -89,13 +109,13 @@ class LoadConfiguration(Bootstrapper):
             name: The configuration key name.
             path: The path to the configuration file.
         """
-        # Load the configuration file
-        spec = __import__("importlib.util").util.spec_from_file_location(name, path)
-        if spec is None or spec.loader is None:
-            return
+        # Only the compiled code is reused; the file still runs for every application, so values it reads from
+        # the environment are current and each repository gets its own config objects
+        code = _compile_configuration_file(str(path), path.stat().st_mtime_ns)
 
-        module = __import__("importlib.util").util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        module = ModuleType(name)
+        module.__file__ = str(path)
+        exec(code, module.__dict__)
 
         # Get the config dict from the module
         if hasattr(module, "config"):
@@ -1,6 +1,6 @@
 import importlib.util
-import inspect
 from pathlib import Path
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, List
 
 from elyx.console import Application as ConsoleApplication
@@ -32,6 +32,7 @@ class ConsoleKernel(KernelContract):
 
     def __init__(self, app: Application, **kwargs):
         self.app = app
+        self._command_modules: dict[Path, ModuleType] = {}
 
     def bootstrappers(self):
         return [
@@ -47,18 +48,25 @@ class ConsoleKernel(KernelContract):
         """Load command classes from a Python file."""
         from elyx.console.command import Command
 
+        # A file reached through both discovery and a registered path is only executed once
+        path = file.resolve()
+        if path in self._command_modules:
+            return
+
         spec = importlib.util.spec_from_file_location(file.stem, file)
         if spec and spec.loader:
             module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(module)
+            self._command_modules[path] = module
 
-            # Find command classes in module - check for Command subclass
-            for name, obj in inspect.getmembers(module):
+            # Find command classes in module - check for Command subclass. The module namespace
+            # is scanned directly; inspect.getmembers would sort it and probe every attribute.
+            for name, obj in vars(module).items():
                 if (
-                    inspect.isclass(obj)
+                    not name.startswith("_")
+                    and isinstance(obj, type)
                     and issubclass(obj, Command)
                     and obj is not Command  # Don't register the base Command class
-                    and not name.startswith("_")
                 ):
                     self.commands.append(obj)
 
@@ -106,11 +114,7 @@ class ConsoleKernel(KernelContract):
         """Register directories to scan for commands."""
         for path in paths:
             if path.is_dir():
-                # Scan directory for Python files
-                for file in path.glob("*.py"):
-                    if file.name.startswith("_"):
-                        continue
-                    self._load_commands_from_file(file)
+                self._discover_commands_from_directory(path)
 
     def _load_command_routes(self, file: Path) -> None:
         """Load and execute command route file."""
@@ -59,12 +59,14 @@ class EnvironmentDetector:
         Returns:
             Environment name or None if not found.
         """
+        # Compare whole tokens or the full "--env=" prefix, so options such as --envelope never match
         for i, value in enumerate(args):
             if value == "--env":
-                return args[i + 1] if i + 1 < len(args) else None
+                # A following option means the flag was given without a value
+                following = args[i + 1] if i + 1 < len(args) else None
+                return None if following is None or following.startswith("--") else following
 
             if value.startswith("--env="):
-                parts = value.split("=", 1)
-                return parts[1] if len(parts) > 1 else None
+                return value[6:]
 
         return None
@@ -1,4 +1,27 @@
 import re
+from functools import lru_cache
+
+# Splits a callback string on its first "Class:method" or "Class::method" separator
+_COLON_SPLIT_RE = re.compile(r"::?")
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, ignore_case: bool) -> re.Pattern:
+    """
+    Compile a wildcard pattern into a regular expression.
+
+    Args:
+        pattern: Pattern with asterisks as wildcards.
+        ignore_case: Whether to ignore case when matching.
+
+    Returns:
+        The compiled regular expression.
+    """
+    # Escape special regex characters, then translate asterisks into zero-or-more wildcards
+    regex = re.escape(pattern).replace(r"\*", ".*")
+
+    flags = re.IGNORECASE | re.DOTALL if ignore_case else re.DOTALL
+    return re.compile(f"^{regex}\\Z", flags)
 
 
 class Str:
@@ -7,10 +30,10 @@ class Str:
     @staticmethod
     def parse_callback(callback: str, default: str | None = None) -> tuple[str, str | None]:
         """
-        Parse a Class:method style callback into class and method.
+        Parse a Class:method or Class::method style callback into class and method.
 
         Args:
-            callback: Callback string in format 'Class:method'.
+            callback: Callback string in format 'Class:method' or 'Class::method'.
             default: Default method name if not specified.
 
         Returns:
@@ -25,8 +48,8 @@ class Str:
 
             return (callback, default)
 
-        if Str.contains(callback, ":"):
-            parts = callback.split(":", 1)
+        parts = _COLON_SPLIT_RE.split(callback, 1)
+        if len(parts) == 2:
             return (parts[0], parts[1])
         return (callback, default)
 
@@ -190,16 +213,13 @@ class Str:
             if ignore_case and p.lower() == value.lower():
                 return True
 
-            # Escape special regex characters except asterisks
-            p = re.escape(p)
-
-            # Asterisks are translated into zero-or-more regular expression wildcards
-            # to make it convenient to check if the strings starts with the given
-            # pattern such as "library/*", making any string check convenient.
-            p = p.replace(r"\*", ".*")
+            # Without an asterisk the pattern can only match exactly, which was checked above
+            if "*" not in p:
+                continue
 
-            flags = re.IGNORECASE | re.DOTALL if ignore_case else re.DOTALL
-            if re.match(f"^{p}\\Z", value, flags):
+            # Wildcard patterns such as "library/*" are compiled once and reused for every
+            # later check, since the same few patterns tend to be tested over and over.
+            if _compile_pattern(p, ignore_case).match(value):
                 return True
 
         return False
@@ -39,6 +39,71 @@ class ContainerDependentStub:
         pass
 
 
+class ContainerReplaceableConstructorStub:
+    pass
+
+
+class ContainerDependentChildStub(ContainerDependentStub):
+    pass
+
+
+def container_constructor_needing(dependency):
+    def __init__(self, value):
+        self.value = value
+
+    # Generated constructors share one code object but carry their own annotations
+    __init__.__annotations__ = {"value": dependency}
+    return __init__
+
+
+class ContainerFactoryConstructorStubOne:
+    __init__ = container_constructor_needing(ContainerConcreteStub)
+
+
+class ContainerFactoryConstructorStubTwo:
+    __init__ = container_constructor_needing(ContainerImplementationStub)
+
+
+class MethodDependencyStub:
+    def instance_method(self, stub: ContainerConcreteStub):
+        return stub
+
+    @classmethod
+    def class_method(cls, stub: ContainerConcreteStub):
+        return cls, stub
+
+
+class ContainerPairStub:
+    def __init__(self, first: ContainerConcreteStub, second: ContainerConcreteStub):
+        self.first = first
+        self.second = second
+
+
+class ContainerForwardReferenceStub:
+    def __init__(self, stub: "ContainerConcreteStub"):  # noqa: UP037
+        self.stub = stub
+
+
+class ContainerStringKeyStub:
+    def __init__(self, name: "container_test_name"):  # noqa: F821, UP037  # ty:ignore[unresolved-reference]
+        self.name = name
+
+
+class ContainerMixedAnnotationStub:
+    def __init__(
+        self,
+        stub: "ContainerConcreteStub",  # noqa: UP037
+        name: "container_test_name",  # noqa: F821, UP037  # ty:ignore[unresolved-reference]
+    ):
+        self.stub = stub
+        self.name = name
+
+
+class ContainerModuleNamedKeyStub:
+    def __init__(self, runner: "pytest"):  # noqa: UP037  # ty:ignore[invalid-type-form]
+        self.runner = runner
+
+
 class ContainerNestedDependentStub:
     def __init__(self, inner: ContainerDependentStub):
         self.inner = inner
@@ -302,6 +367,22 @@ class TestContainer(BaseTest):
         container.alias("foo", "baz")
         assert container.make("baz", config=[1, 2, 3]) == [1, 2, 3]
 
+    def test_keys_are_found_by_equal_strings_built_at_runtime(self):
+        """Test that bindings, instances and aliases are found by an equal but non-identical key string."""
+        from elyx.container.container import Container
+
+        container = Container()
+        container.bind("".join(["service", ".foo"]), lambda: "bound")
+        container.instance("".join(["service", ".bar"]), "instance")
+        container.alias("service.foo", "".join(["alias", ".foo"]))
+
+        key = "".join(["service", ".", "foo"])
+        assert key is not "".join(["service", ".foo"])
+        assert container.make(key) == "bound"
+        assert container.make("".join(["service", ".", "bar"])) == "instance"
+        assert container.make("".join(["alias", ".", "foo"])) == "bound"
+        assert container.bound("".join(["alias", ".", "foo"]))
+
     def test_bindings_can_be_overridden(self):
         """Test that bindings can be overridden."""
         from elyx.container.container import Container
@@ -330,6 +411,132 @@ class TestContainer(BaseTest):
         resolved = container.make("foo")
         assert bound is resolved
 
+    def test_none_instance_is_returned_instead_of_the_binding(self):
+        """Test that an instance registered as None still takes precedence over the binding."""
+        from elyx.container.container import Container
+
+        container = Container()
+        container.bind("foo", lambda: "bar")
+        container.instance("foo", None)
+        assert container.make("foo") is None
+
+    def test_build_follows_a_replaced_constructor(self):
+        """Test that a class is built with its current constructor after it has been resolved once."""
+        from elyx.container.container import Container
+
+        container = Container()
+        assert isinstance(container.make(ContainerReplaceableConstructorStub), ContainerReplaceableConstructorStub)
+
+        def __init__(self, stub: ContainerConcreteStub):
+            self.stub = stub
+
+        ContainerReplaceableConstructorStub.__init__ = __init__  # ty:ignore[invalid-assignment]
+
+        try:
+            assert isinstance(container.make(ContainerReplaceableConstructorStub).stub, ContainerConcreteStub)
+        finally:
+            del ContainerReplaceableConstructorStub.__init__
+
+    def test_subclasses_inheriting_a_constructor_resolve_their_dependencies(self):
+        """Test that a subclass reuses its parent's cached constructor plan but resolves its own dependencies."""
+        from elyx.container.container import Container, _cached_build_plan
+
+        container = Container()
+        container.bind(IContainerContractStub, ContainerImplementationStub)
+
+        parent = container.make(ContainerDependentStub)
+        misses = _cached_build_plan.cache_info().misses
+
+        container.when(ContainerDependentChildStub).needs(IContainerContractStub).give(
+            lambda app: ContainerImplementationStubTwo()
+        )
+        child = container.make(ContainerDependentChildStub)
+
+        assert _cached_build_plan.cache_info().misses == misses
+        assert type(parent) is ContainerDependentStub
+        assert type(child) is ContainerDependentChildStub
+        assert isinstance(parent.impl, ContainerImplementationStub)
+        assert isinstance(child.impl, ContainerImplementationStubTwo)
+
+    def test_constructors_sharing_code_keep_their_own_dependencies(self):
+        """Test that constructors made from the same code object are built with their own annotated dependencies."""
+        from elyx.container.container import Container
+
+        container = Container()
+
+        assert isinstance(container.make(ContainerFactoryConstructorStubOne).value, ContainerConcreteStub)
+        assert isinstance(container.make(ContainerFactoryConstructorStubTwo).value, ContainerImplementationStub)
+
+    def test_unshared_dependencies_are_built_for_each_parameter(self):
+        """Test that a dependency needed twice by one constructor is built twice unless it is shared."""
+        from elyx.container.container import Container
+
+        container = Container()
+        pair = container.make(ContainerPairStub)
+        assert pair.first is not pair.second
+
+        container.singleton(ContainerConcreteStub)
+        pair = container.make(ContainerPairStub)
+        assert pair.first is pair.second
+
+    def test_string_annotations_resolve_to_their_classes(self):
+        """Test that quoted annotations are resolved as classes and unknown names as container keys."""
+        from elyx.container.container import Container
+
+        container = Container()
+        container.bind("container_test_name", lambda: "use_the_fork")
+
+        assert isinstance(container.make(ContainerForwardReferenceStub).stub, ContainerConcreteStub)
+        assert container.make(ContainerStringKeyStub).name == "use_the_fork"
+
+    def test_string_annotations_naming_a_global_that_is_not_a_class_stay_container_keys(self):
+        """Test that a string annotation shadowing a module-level global that is not a class resolves the bound key."""
+        from elyx.container.container import Container
+
+        container = Container()
+        container.instance("pytest", "use_the_fork")
+
+        assert container.make(ContainerModuleNamedKeyStub).runner == "use_the_fork"
+
+    def test_string_annotations_are_resolved_one_by_one(self):
+        """Test that a string annotation naming a container key does not stop its neighbours resolving as classes."""
+        from elyx.container.container import Container
+
+        container = Container()
+        container.bind("container_test_name", lambda: "use_the_fork")
+
+        for _ in range(2):
+            mixed = container.make(ContainerMixedAnnotationStub)
+            assert isinstance(mixed.stub, ContainerConcreteStub)
+            assert mixed.name == "use_the_fork"
+
+    def test_circular_dependencies_are_detected(self):
+        """Test that resolving a circular dependency raises instead of recursing."""
+        from elyx.container.container import Container
+        from elyx.exceptions import CircularDependencyException
+
+        container = Container()
+        container.bind("first", lambda app: app.make("second"))
+        container.bind("second", lambda app: app.make("first"))
+        container.bind(IContainerContractStub, lambda app: app.make(ContainerDependentStub))
+
+        with pytest.raises(CircularDependencyException, match=r"\[first\]"):
+            container.make("first")
+
+        with pytest.raises(CircularDependencyException):
+            container.get(IContainerContractStub)
+
+    def test_shared_dependencies_are_not_circular(self):
+        """Test that a dependency needed twice in one graph is not reported as circular."""
+        from elyx.container.container import Container
+
+        container = Container()
+        container.bind("pair", lambda app: (app.make(ContainerDefaultValueStub), app.make(ContainerDefaultValueStub)))
+
+        first, second = container.make("pair")
+        assert isinstance(first.stub, ContainerConcreteStub)
+        assert isinstance(second.stub, ContainerConcreteStub)
+
     def test_resolution_of_default_parameters(self):
         """Test that the container correctly resolves dependencies with default parameters."""
         from elyx.container.container import Container
@@ -524,6 +731,20 @@ class TestContainer(BaseTest):
         factory = container.factory("name")
         assert container.make("name") == factory()
 
+    def test_container_methods_can_be_replaced_per_instance(self):
+        """Test that a container instance accepts its own method replacement without affecting other instances."""
+        from elyx.container.container import Container
+
+        container = Container()
+        setattr(container, "make", lambda abstract, **kwargs: "patched")
+
+        assert container.make("foo") == "patched"
+        assert "make" in vars(container)
+
+        other = Container()
+        other.bind("foo", lambda: "bar")
+        assert other.make("foo") == "bar"
+
     def test_make_with_is_alias_for_make(self, mocker):
         """Test that make_with is an alias for the make method."""
         from elyx.container.container import Container
@@ -740,6 +961,17 @@ class TestContainer(BaseTest):
 
         assert result == "foo"
 
+    def test_call_injects_dependencies_into_bound_and_class_methods(self):
+        """Test that call injects dependencies into instance and class methods, skipping their bound argument."""
+        container = self.container
+
+        assert isinstance(container.call(MethodDependencyStub().instance_method), ContainerConcreteStub)
+        assert isinstance(container.call(MethodDependencyStub().instance_method), ContainerConcreteStub)
+
+        cls, stub = container.call(MethodDependencyStub.class_method)
+        assert cls is MethodDependencyStub
+        assert isinstance(stub, ContainerConcreteStub)
+
     # def test_no_matching_environment_and_no_wildcard_throws_exception(self):
     #     """Test that an exception is thrown if no binding matches the environment and no wildcard exists."""
     #     container = self.container
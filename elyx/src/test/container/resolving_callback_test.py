@@ -524,3 +524,36 @@ class TestResolvingCallback(BaseTest):
         instance = container.make("foo")
 
         assert instance.name == "Fork"
+
+    def test_callbacks_registered_after_a_resolution_are_called(self):
+        """Test that callbacks registered after the first resolution are called on the next one."""
+        container = self.container
+        calls = []
+
+        container.bind("foo", lambda: ResolvingImplementationStubThree())
+        container.make("foo")
+
+        container.before_resolving("foo", lambda abstract, parameters, app: calls.append("before"))
+        container.resolving("foo", lambda instance, app: calls.append("resolving"))
+        container.after_resolving("foo", lambda instance, app: calls.append("after"))
+        container.make("foo")
+
+        assert calls == ["before", "resolving", "after"]
+
+    def test_callbacks_registered_while_firing_run_on_the_next_resolution(self):
+        """Test that a callback registered by another callback is not called in the same resolution."""
+        container = self.container
+        calls = []
+
+        def register_another(instance, app):
+            calls.append("first")
+            app.resolving("foo", lambda instance, app: calls.append("second"))
+
+        container.bind("foo", lambda: ResolvingImplementationStubThree())
+        container.resolving("foo", register_another)
+
+        container.make("foo")
+        assert calls == ["first"]
+
+        container.make("foo")
+        assert calls == ["first", "first", "second"]
@@ -1,3 +1,6 @@
+from enum import StrEnum
+
+import pytest
 from test.base_test import BaseTest
 
 
@@ -21,6 +24,15 @@ class ExampleEvent:
     pass
 
 
+class ExampleChildEvent(ExampleEvent):
+    pass
+
+
+class OrderEventName(StrEnum):
+    PLACED = "order.placed"
+    SHIPPED = "order.shipped"
+
+
 class TestEvent:
     pass
 
@@ -62,6 +74,16 @@ class DisptachListener2Falser:
         return False
 
 
+class SyncCallableListener:
+    def __call__(self, value):
+        return value + "-object"
+
+
+class AsyncCallableListener:
+    async def __call__(self, value):
+        return value + "-async-object"
+
+
 class TestEventDispatcher(BaseTest):
     """Test suite for Event Dispatcher class."""
 
@@ -92,6 +114,190 @@ class TestEventDispatcher(BaseTest):
         await dispatcher.dispatch("foo", "bar")
         assert test_storage["event_result"] == "barbar"
 
+    async def test_str_enum_event_names(self):
+        """Test that StrEnum members can be listened for and dispatched like their string values."""
+        from elyx.events.dispatcher import Dispatcher
+
+        dispatcher = Dispatcher(self.container)
+        dispatcher.listen(OrderEventName.PLACED, lambda value: value + "-placed")
+        dispatcher.listen("order.shipped", lambda value: value + "-shipped")
+
+        assert await dispatcher.dispatch(OrderEventName.PLACED, "foo") == ["foo-placed"]
+        assert await dispatcher.dispatch("order.placed", "foo") == ["foo-placed"]
+        assert await dispatcher.dispatch(OrderEventName.SHIPPED, "foo") == ["foo-shipped"]
+        assert dispatcher.has_listeners(OrderEventName.PLACED)
+
+    async def test_event_objects_are_looked_up_by_their_class(self):
+        """Test that an event object passed in place of an event name is keyed by its class."""
+        from elyx.events.dispatcher import Dispatcher
+
+        dispatcher = Dispatcher(self.container)
+        received = []
+        dispatcher.listen(ExampleEvent, received.append)
+
+        dispatcher.push(ExampleEvent(), "foo")
+        await dispatcher.flush(ExampleEvent)
+
+        assert received == ["foo"]
+
+    async def test_non_callable_listeners_are_rejected(self):
+        """Test that registering a listener that cannot be called raises a TypeError."""
+        from elyx.events.dispatcher import Dispatcher
+
+        dispatcher = Dispatcher(self.container)
+
+        with pytest.raises(TypeError) as exc_info:
+            dispatcher.listen("foo", 42)
+        assert "int given" in str(exc_info.value)
+        assert not dispatcher.has_listeners("foo")
+
+    async def test_async_listeners_are_awaited(self):
+        """Test that coroutine listeners are awaited and their results collected in order."""
+        from elyx.events.dispatcher import Dispatcher
+
+        dispatcher = Dispatcher(self.container)
+
+        async def async_listener(value):
+            return value + "-async"
+
+        def sync_listener(value):
+            return value + "-sync"
+
+        dispatcher.listen("foo", async_listener)
+        dispatcher.listen("foo", sync_listener)
+
+        response = await dispatcher.dispatch("foo", "bar")
+
+        assert response == ["bar-async", "bar-sync"]
+
+    async def test_callable_object_and_partial_listeners_are_classified_at_registration(self):
+        """Test that callable objects and partials only take the awaiting path when they are async."""
+        from functools import partial
+
+        from elyx.events.dispatcher import Dispatcher
+
+        async def async_listener(suffix, value):
+            return value + suffix
+
+        dispatcher = Dispatcher(self.container)
+        dispatcher.listen("foo", SyncCallableListener())
+        dispatcher.listen("foo", partial(str.__add__, "bar-"))
+
+        assert dispatcher.dispatch_sync("foo", "baz") == ["baz-object", "bar-baz"]
+        assert "foo" not in dispatcher.async_events
+
+        dispatcher.listen("foo", AsyncCallableListener())
+        dispatcher.listen("foo", partial(async_listener, "-partial"))
+
+        response = await dispatcher.dispatch("foo", "baz")
+
+        assert response == ["baz-object", "bar-baz", "baz-async-object", "baz-partial"]
+
+    async def test_coroutines_returned_by_sync_callables_are_awaited(self):
+        """Test that coroutines handed back by lambdas and sync decorators are awaited in listener order."""
+        import functools
+
+        from elyx.events.dispatcher import Dispatcher
+
+        calls = []
+
+        async def work(value):
+            calls.append("work")
+            return value + "-done"
+
+        def logged(func):
+            @functools.wraps(func)
+            def wrapper(*args):
+                return func(*args)
+
+            return wrapper
+
+        @logged
+        async def decorated(value):
+            return value + "-decorated"
+
+        dispatcher = Dispatcher(self.container)
+        dispatcher.listen("foo", lambda value: work(value))
+        dispatcher.listen("foo", lambda value: calls.append("after") or value + "-sync")
+        dispatcher.listen("bar", decorated)
+
+        assert await dispatcher.dispatch("foo", "v") == ["v-done", "v-sync"]
+        assert calls == ["work", "after"]
+        assert await dispatcher.dispatch("foo", "v") == ["v-done", "v-sync"]
+        assert await dispatcher.dispatch("bar", "v", halt=True) == "v-decorated"
+
+        dispatcher.push("bar", "w")
+        dispatcher.listen("bar", lambda value: calls.append(value))
+        await dispatcher.flush("bar")
+        assert calls[-1] == "w"
+
+        with pytest.raises(RuntimeError):
+            dispatcher.dispatch_sync("bar", "v")
+
+    async def test_async_listener_added_after_sync_dispatch_is_awaited(self):
+        """Test that a sync-only event switches to awaiting once an async listener is added."""
+        from elyx.events.dispatcher import Dispatcher
+
+        dispatcher = Dispatcher(self.container)
+
+        async def async_listener(value):
+            return value + "-async"
+
+        dispatcher.listen("foo", lambda value: value + "-sync")
+        assert await dispatcher.dispatch("foo", "bar") == ["bar-sync"]
+
+        dispatcher.listen("foo", async_listener)
+        assert await dispatcher.dispatch("foo", "bar") == ["bar-sync", "bar-async"]
+
+    async def test_async_listeners_can_be_awaited_concurrently(self):
+        """Test that concurrent dispatch overlaps async listeners and keeps responses in order."""
+        import asyncio
+
+        from elyx.events.dispatcher import Dispatcher
+
+        steps = []
+
+        dispatcher = Dispatcher(self.container)
+
+        async def first(value):
+            steps.append("first started")
+            await asyncio.sleep(0)
+            steps.append("first finished")
+            return "first"
+
+        async def second(value):
+            steps.append("second started")
+            await asyncio.sleep(0)
+            steps.append("second finished")
+            return "second"
+
+        dispatcher.listen("foo", first)
+        dispatcher.listen("foo", lambda value: "sync")
+        dispatcher.listen("foo", second)
+
+        response = await dispatcher.dispatch("foo", "bar", concurrent=True)
+
+        assert response == ["first", "sync", "second"]
+        assert steps == ["first started", "second started", "first finished", "second finished"]
+
+    async def test_dispatch_sync_calls_listeners_without_awaiting(self):
+        """Test that dispatch_sync returns responses directly and rejects async listeners."""
+        from elyx.events.dispatcher import Dispatcher
+
+        dispatcher = Dispatcher(self.container)
+        dispatcher.listen("foo", lambda value: value + "-sync")
+
+        assert dispatcher.dispatch_sync("foo", "bar") == ["bar-sync"]
+        assert dispatcher.dispatch_sync("foo", "bar", halt=True) == "bar-sync"
+
+        async def async_listener(value):
+            return value
+
+        dispatcher.listen("foo", async_listener)
+
+        with pytest.raises(RuntimeError):
+            dispatcher.dispatch_sync("foo", "bar")
+
     async def test_defer_event_execution(self):
         """Test that events are deferred during callback execution."""
         from elyx.events.dispatcher import Dispatcher
@@ -173,6 +379,67 @@ class TestEventDispatcher(BaseTest):
 
         assert event_results == ["inner", "outer1", "outer2"]
 
+    async def test_defer_does_not_leak_into_concurrent_tasks(self):
+        """Test that events dispatched by another task are not deferred by an unrelated defer() call."""
+        import asyncio
+
+        from elyx.events.dispatcher import Dispatcher
+
+        event_results = []
+
+        dispatcher = Dispatcher(self.container)
+        dispatcher.listen("foo", lambda value: event_results.append(value))
+
+        started = asyncio.Event()
+        released = asyncio.Event()
+
+        async def deferring():
+            async def callback():
+                await dispatcher.dispatch("foo", "deferred")
+                started.set()
+                await released.wait()
+
+            await dispatcher.defer(callback)
+
+        async def concurrent():
+            await started.wait()
+            await dispatcher.dispatch("foo", "immediate")
+            assert event_results == ["immediate"]
+            released.set()
+
+        await asyncio.gather(deferring(), concurrent())
+
+        assert event_results == ["immediate", "deferred"]
+
+    async def test_defer_does_not_swallow_events_of_tasks_outliving_it(self):
+        """Test that a task spawned inside defer() dispatches immediately once the defer() call has finished."""
+        import asyncio
+
+        from elyx.events.dispatcher import Dispatcher
+
+        event_results = []
+        tasks = []
+
+        dispatcher = Dispatcher(self.container)
+        dispatcher.listen("foo", lambda value: event_results.append(value))
+
+        released = asyncio.Event()
+
+        async def later():
+            await released.wait()
+            await dispatcher.dispatch("foo", "late")
+
+        def callback():
+            tasks.append(asyncio.create_task(later()))
+
+        await dispatcher.defer(callback)
+        assert event_results == []
+
+        released.set()
+        await tasks[0]
+
+        assert event_results == ["late"]
+
     async def test_defer_specific_events(self):
         """Test that only specific events can be deferred."""
         from elyx.events.dispatcher import Dispatcher
@@ -301,6 +568,12 @@ class TestEventDispatcher(BaseTest):
         response = await dispatcher.dispatch("foo", [], halt=True)
         assert response is None
 
+        dispatcher.listen("bar", lambda: "bar")
+
+        assert await dispatcher.dispatch("foo") == []
+        assert await dispatcher.dispatch("foo", [], halt=True) is None
+        assert dispatcher.dispatch_sync("foo") == []
+
     async def test_returning_false_stops_propagation(self):
         """Test that returning False from a listener stops event propagation."""
         from elyx.events.dispatcher import Dispatcher
@@ -459,6 +732,63 @@ class TestEventDispatcher(BaseTest):
 
         assert test_storage["event_test"] == "hello world"
 
+    async def test_coalesced_pushed_events_are_flushed_once(self):
+        """Test that coalesced pushes replace the queued payload so only the latest one is flushed."""
+        from elyx.events.dispatcher import Dispatcher
+
+        calls = []
+
+        dispatcher = Dispatcher(self.container)
+        dispatcher.listen("update", lambda value: calls.append(value))
+
+        dispatcher.push("update", ["first"], coalesce=True)
+        dispatcher.push("update", ["second"], coalesce=True)
+        dispatcher.push("update", ["third"], coalesce=True)
+
+        await dispatcher.flush("update")
+
+        assert calls == ["third"]
+
+    async def test_flush_calls_the_listeners_resolved_when_it_started(self):
+        """Test that listeners registered while flushing only receive later flushes."""
+        from elyx.events.dispatcher import Dispatcher
+
+        calls = []
+
+        dispatcher = Dispatcher(self.container)
+
+        async def first(value):
+            calls.append(("first", value))
+            dispatcher.listen("update", lambda late: calls.append(("late", late)))
+
+        dispatcher.listen("update", first)
+        dispatcher.push("update", ["a"])
+        dispatcher.push("update", ["b"])
+
+        await dispatcher.flush("update")
+
+        assert calls == [("first", "a"), ("first", "b")]
+
+    async def test_pushed_payloads_are_unpacked_and_flushed_once(self):
+        """Test that pushed list payloads are unpacked into listener arguments and flushed only once."""
+        from elyx.events.dispatcher import Dispatcher
+
+        # Create a test storage list to simulate state
+        test_storage = []
+
+        dispatcher = Dispatcher(self.container)
+
+        def listener(first, second):
+            test_storage.append(first + second)
+
+        dispatcher.listen("update", listener)
+        dispatcher.push("update", ["foo", "bar"])
+
+        await dispatcher.flush("update")
+        await dispatcher.flush("update")
+
+        assert test_storage == ["foobar"]
+
     async def test_push_method_can_accept_object_as_payload(self):
         """Test that push method can accept an object as payload."""
         from elyx.events.dispatcher import Dispatcher
@@ -530,6 +860,22 @@ class TestEventDispatcher(BaseTest):
 
         assert response == ["regular", "wildcard"]
 
+    async def test_every_matching_wildcard_pattern_is_called_in_order(self):
+        """Test that all overlapping wildcard patterns fire, in the order they were registered."""
+        from elyx.events.dispatcher import Dispatcher
+
+        calls = []
+
+        dispatcher = Dispatcher(self.container)
+        dispatcher.listen("foo.*", lambda event, payload: calls.append("foo.*"))
+        dispatcher.listen("*.bar", lambda event, payload: calls.append("*.bar"))
+        dispatcher.listen("baz.*", lambda event, payload: calls.append("baz.*"))
+        dispatcher.listen("*", lambda event, payload: calls.append("*"))
+
+        await dispatcher.dispatch("foo.bar")
+
+        assert calls == ["foo.*", "*.bar", "*"]
+
     async def test_wildcard_listeners_cache_flushing(self):
         """Test that wildcard listeners cache is flushed when new listeners are added."""
         from elyx.events.dispatcher import Dispatcher
@@ -553,6 +899,64 @@ class TestEventDispatcher(BaseTest):
         await dispatcher.dispatch("foo.bar")
         assert test_storage["event_test"] == "new_wildcard"
 
+    async def test_cached_listeners_are_flushed_when_forgotten(self):
+        """Test that forgetting an event drops the listeners cached by a previous dispatch."""
+        from elyx.events.dispatcher import Dispatcher
+
+        calls = []
+
+        dispatcher = Dispatcher(self.container)
+        dispatcher.listen("foo", lambda: calls.append("foo"))
+        dispatcher.listen("foo.*", lambda event, payload: calls.append(event))
+
+        await dispatcher.dispatch("foo")
+        await dispatcher.dispatch("foo.bar")
+        dispatcher.forget("foo")
+        dispatcher.forget("foo.*")
+        await dispatcher.dispatch("foo")
+        await dispatcher.dispatch("foo.bar")
+
+        assert calls == ["foo", "foo.bar"]
+
+    async def test_listeners_cache_only_keeps_a_bounded_number_of_events_with_listeners(self):
+        """Test that events without listeners are not cached and the cache never outgrows its bound."""
+        from elyx.events.dispatcher import _LISTENERS_CACHE_SIZE, Dispatcher
+
+        dispatcher = Dispatcher(self.container)
+        dispatcher.listen("user.*", lambda event, payload: event)
+
+        assert not dispatcher.has_listeners("order.placed")
+        assert await dispatcher.dispatch("order.shipped") == []
+        assert not dispatcher.listeners_cache
+
+        for index in range(_LISTENERS_CACHE_SIZE + 1):
+            assert await dispatcher.dispatch(f"user.{index}") == [f"user.{index}"]
+
+        assert len(dispatcher.listeners_cache) == _LISTENERS_CACHE_SIZE
+        assert "user.0" not in dispatcher.listeners_cache
+        assert await dispatcher.dispatch("user.0") == ["user.0"]
+
+    async def test_single_listener_can_be_forgotten(self):
+        """Test that forget with a listener removes only that listener."""
+        from elyx.events.dispatcher import Dispatcher
+
+        calls = []
+
+        def first(value):
+            calls.append("first")
+
+        def second(value):
+            calls.append("second")
+
+        dispatcher = Dispatcher(self.container)
+        dispatcher.listen("foo", first)
+        dispatcher.listen("foo", second)
+        dispatcher.forget("foo", first)
+
+        await dispatcher.dispatch("foo", "bar")
+
+        assert calls == ["second"]
+
     async def test_listeners_can_be_removed(self):
         """Test that listeners can be removed using forget."""
         from elyx.events.dispatcher import Dispatcher
@@ -571,6 +975,58 @@ class TestEventDispatcher(BaseTest):
 
         assert "event_test" not in test_storage
 
+    async def test_single_listener_can_be_detached(self):
+        """Test that the handle returned by listen detaches only that listener."""
+        from elyx.events.dispatcher import Dispatcher
+
+        # Create a test storage list to simulate state
+        test_storage = []
+
+        dispatcher = Dispatcher(self.container)
+
+        def first_listener():
+            test_storage.append("first")
+
+        def second_listener(event, payload):
+            test_storage.append("second")
+
+        handle = dispatcher.listen("foo.bar", first_listener)
+        wildcard_handle = dispatcher.listen("foo.*", second_listener)
+        dispatcher.listen("foo.bar", first_listener)
+
+        handle.detach()
+        await dispatcher.dispatch("foo.bar")
+        assert test_storage == ["first", "second"]
+
+        wildcard_handle.detach()
+        await dispatcher.dispatch("foo.bar")
+        assert test_storage == ["first", "second", "first"]
+        assert dispatcher.has_wildcard_listeners("foo.bar") is False
+
+    async def test_listener_handles_can_be_merged(self):
+        """Test that a handle extended with another handle detaches the listeners of both."""
+        from elyx.events.dispatcher import Dispatcher
+
+        calls = []
+
+        dispatcher = Dispatcher(self.container)
+
+        def listener(event: ExampleEvent):
+            calls.append("closure")
+
+        handle = dispatcher.listen(listener)
+        handle.extend(dispatcher.listen("foo", lambda: calls.append("foo")))
+
+        handle.detach()
+        await dispatcher.dispatch(ExampleEvent())
+        await dispatcher.dispatch("foo")
+
+        assert calls == []
+        assert not dispatcher.listeners
+
+        with pytest.raises(ValueError, match="different dispatchers"):
+            handle.extend(Dispatcher(self.container).listen("foo", lambda: None))
+
     async def test_wildcard_listeners_can_be_removed(self):
         """Test that wildcard listeners can be removed using forget."""
         from elyx.events.dispatcher import Dispatcher
@@ -672,6 +1128,26 @@ class TestEventDispatcher(BaseTest):
 
         assert test_storage["event_test"] == "baz"
 
+    async def test_event_subclasses_also_call_parent_listeners(self):
+        """Test that a subclass keeps its own key and also calls the listeners of its base classes."""
+        from elyx.events.dispatcher import Dispatcher
+
+        calls = []
+
+        dispatcher = Dispatcher(self.container)
+        dispatcher.listen(ExampleEvent, lambda event: calls.append("parent"))
+        dispatcher.listen(ExampleChildEvent, lambda event: calls.append("child"))
+
+        await dispatcher.dispatch(ExampleEvent())
+        assert calls == ["parent"]
+
+        await dispatcher.dispatch(ExampleChildEvent())
+        assert calls == ["parent", "child", "parent"]
+
+        dispatcher.forget(ExampleEvent)
+        await dispatcher.dispatch(ExampleChildEvent())
+        assert calls == ["parent", "child", "parent", "child"]
+
     async def test_classes_work_with_anonymous_listeners(self):
         """Test that event classes work with anonymous listeners."""
         from elyx.events.dispatcher import Dispatcher
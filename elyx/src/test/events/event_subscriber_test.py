@@ -103,3 +103,21 @@ class TestEventsSubscriber(BaseTest):
 
         await dispatcher.dispatch("myEvent2")
         assert test_storage == ["L1_", "L2_", "L3"]
+
+    async def test_subscriber_class_handlers_use_the_resolved_subscriber(self):
+        """Test that handlers naming the subscriber's own class are bound to the resolved instance."""
+        from elyx.events.dispatcher import Dispatcher
+
+        test_storage.clear()
+        resolutions = []
+
+        self.container.bind(DeclarativeSubscriber)
+        self.container.resolving(DeclarativeSubscriber, lambda *args: resolutions.append(DeclarativeSubscriber))
+
+        dispatcher = Dispatcher(self.container)
+        await dispatcher.subscribe(DeclarativeSubscriber)
+
+        await dispatcher.dispatch("myEvent2")
+        await dispatcher.dispatch("myEvent2")
+        assert test_storage == ["L3", "L3"]
+        assert resolutions == [DeclarativeSubscriber]
@@ -31,6 +31,15 @@ class InterfaceToImplementationDeferredServiceProvider(ServiceProvider):
         self.app.bind(SampleClassStub, SampleClassImplementationStub)
 
 
+class BaseProviderStub(ServiceProvider):
+    def register(self) -> None:
+        pass
+
+
+class ChildProviderStub(BaseProviderStub):
+    pass
+
+
 class AbstractClassStub(ABC):
     @abstractmethod
     def get_value(self):
@@ -53,6 +62,22 @@ class ConcreteTerminator:
         ConcreteTerminator.counter += 1
 
 
+class BootingProviderStub(ServiceProvider):
+    def register(self) -> None:
+        pass
+
+    def boot(self) -> None:
+        self.app.instance("booted.plain", True)
+
+
+class InjectedBootingProviderStub(ServiceProvider):
+    def register(self) -> None:
+        pass
+
+    def boot(self, terminator: ConcreteTerminator) -> None:  # ty:ignore[invalid-method-override]
+        self.app.instance("booted.injected", terminator)
+
+
 class TestFoundationApplication(BaseTest):
     """Test suite for Application class."""
 
@@ -96,6 +121,79 @@ class TestFoundationApplication(BaseTest):
 
         assert 1 == ConcreteTerminator.counter
 
+    def test_termination_callbacks_can_accept_double_colon_notation(self):
+        """Test that termination callbacks can accept class::method notation."""
+        ConcreteTerminator.counter = 0
+
+        self.app.terminating("foundation_application_test.ConcreteTerminator::terminate")
+
+        self.app.terminate()
+
+        assert 1 == ConcreteTerminator.counter
+
+    def test_get_providers_returns_registered_instances_of_the_class(self):
+        """Test that get_providers finds registered providers by class, subclass, class name or instance."""
+        base = self.app.register(BaseProviderStub(self.app))
+        child = self.app.register(ChildProviderStub(self.app))
+
+        assert [base, child] == self.app.get_providers(BaseProviderStub)
+        assert [child] == self.app.get_providers(ChildProviderStub)
+        assert [child] == self.app.get_providers(f"{__name__}.ChildProviderStub")
+        assert [child] == self.app.get_providers(child)
+        assert [] == self.app.get_providers(NonContractBackedClass)
+
+        self.app.register(child, force=True)
+
+        assert [base, child] == self.app.get_providers(BaseProviderStub)
+
+    def test_termination_callback_strings_are_resolved_when_terminating(self):
+        """Test that class:method termination callbacks are not imported until the application terminates."""
+        self.app.terminating("missing_terminator_module.Terminator:terminate")
+
+        with pytest.raises(ValueError, match="missing_terminator_module"):
+            self.app.terminate()
+
+    def test_providers_registered_after_boot_are_booted(self):
+        """Test that providers registered after boot are booted, with or without boot dependencies."""
+        self.app.boot()
+
+        self.app.register(BootingProviderStub(self.app))
+        self.app.register(InjectedBootingProviderStub(self.app))
+
+        assert self.app.make("booted.plain") is True
+        assert isinstance(self.app.make("booted.injected"), ConcreteTerminator)
+
+    def test_provider_classes_are_only_registered_once(self):
+        """Test that registering a provider class again returns the provider that is already registered."""
+        provider = self.app.register(BaseProviderStub)
+
+        assert provider is self.app.register(BaseProviderStub)
+        assert provider is self.app.register(f"{__name__}.BaseProviderStub")
+        assert provider is self.app.get_provider(BaseProviderStub)
+        assert provider is self.app.get_provider(provider)
+        assert self.app.get_provider(ChildProviderStub) is None
+
+    def test_providers_can_be_registered_by_class_name(self):
+        """Test that a provider given as a dotted class name is imported and registered."""
+        provider = self.app.register(f"{__name__}.BootingProviderStub")
+
+        assert isinstance(provider, BootingProviderStub)
+        assert [provider] == self.app.get_providers(BootingProviderStub)
+
+    def test_making_shared_instances_still_fires_before_resolving_callbacks(self):
+        """Test that making an existing shared instance returns it and still fires before resolving callbacks."""
+        calls = []
+        instance = object()
+
+        self.app.instance("shared", instance)
+
+        assert self.app.make("shared") is instance
+
+        self.app.before_resolving("shared", lambda abstract, parameters, app: calls.append(abstract))
+
+        assert self.app["shared"] is instance
+        assert calls == ["shared"]
+
     def test_booting_callbacks(self):
         """Test that booting callbacks are executed during boot."""
         counter = {"value": 0}
@@ -115,6 +213,22 @@ class TestFoundationApplication(BaseTest):
 
         assert 2 == counter["value"]
 
+    def test_booting_callbacks_registered_while_booting_are_fired(self):
+        """Test that a booting callback registered by another booting callback runs during the same boot."""
+        calls = []
+
+        def inner(app):
+            calls.append("inner")
+
+        def outer(app):
+            calls.append("outer")
+            app.booting(inner)
+
+        self.app.booting(outer)
+        self.app.boot()
+
+        assert calls == ["outer", "inner"]
+
     def test_after_bootstrapping_adds_closure(self):
         """Test that afterBootstrapping registers event listeners for bootstrapper completion."""
         from elyx.foundation import RegisterFacades
@@ -160,6 +274,23 @@ class TestFoundationApplication(BaseTest):
 
         assert 4 == counter["value"]
 
+    def test_booted_callbacks_registered_while_booting_are_fired_once(self):
+        """Test that a booted callback registered by another booted callback runs during the same boot."""
+        calls = []
+
+        def inner(app):
+            calls.append("inner")
+
+        def outer(app):
+            calls.append("outer")
+            app.booted(inner)
+
+        self.app.booted(outer)
+        self.app.boot()
+        self.app.boot()
+
+        assert calls == ["outer", "inner"]
+
     def test_macroable(self):
         """Test that Application supports macros for dynamic method registration."""
         self.app["env"] = "foo"
@@ -207,6 +338,35 @@ class TestFoundationApplication(BaseTest):
         assert {"overwrite": True} == config.get("broadcasting.connections.reverb")
         assert {"merge": True} == config.get("broadcasting.connections.new")
 
+    def test_configuration_files_are_loaded_fresh_for_each_application(self, tmp_path):
+        """Test that reloading a config directory neither shares config objects nor misses edited files."""
+        import os
+
+        from elyx.foundation import Application, LoadConfiguration
+
+        config_file = tmp_path / "app.py"
+        config_file.write_text('config = {"foo": "bar"}\n')
+
+        self.app.use_config_path(tmp_path)
+        self.app.bootstrap_with([LoadConfiguration])
+        self.app.make("config").get("app")["foo"] = "changed"
+
+        app = Application()
+        app.use_config_path(tmp_path)
+        app.bootstrap_with([LoadConfiguration])
+
+        assert "bar" == app.make("config").get("app.foo")
+
+        config_file.write_text('config = {"foo": "baz"}\n')
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        app = Application()
+        app.use_config_path(tmp_path)
+        app.bootstrap_with([LoadConfiguration])
+
+        assert "baz" == app.make("config").get("app.foo")
+
     def test_method_after_loading_environment_adds_closure(self):
         """Test that afterLoadingEnvironment registers event listeners for LoadEnvironmentVariables completion."""
         from elyx.foundation import LoadEnvironmentVariables
@@ -230,61 +390,50 @@ class TestFoundationApplication(BaseTest):
     def test_debug_helper(self):
         """Test that has_debug_mode_enabled correctly returns the debug mode status from configuration."""
         from elyx.config import Repository
-        from elyx.foundation import Application
 
-        debug_off = Application()
-        debug_off["config"] = Repository({"app": {"debug": False}})
+        self.app["config"] = Repository({"app": {"debug": False}})
 
-        assert not debug_off.has_debug_mode_enabled()
+        assert not self.app.has_debug_mode_enabled()
 
-        debug_on = Application()
-        debug_on["config"] = Repository({"app": {"debug": True}})
+        self.app["config"] = Repository({"app": {"debug": True}})
 
-        assert debug_on.has_debug_mode_enabled()
+        assert self.app.has_debug_mode_enabled()
 
     def test_environment_helpers(self):
         """Test that environment helper methods correctly identify the current environment."""
-        from elyx.foundation import Application
-
-        local = Application()
-        local["env"] = "local"
+        self.app["env"] = "local"
 
-        assert local.is_local()
-        assert not local.is_production()
-        assert not local.running_unit_tests()
+        assert self.app.is_local()
+        assert not self.app.is_production()
+        assert not self.app.running_unit_tests()
 
-        production = Application()
-        production["env"] = "production"
+        self.app["env"] = "production"
 
-        assert production.is_production()
-        assert not production.is_local()
-        assert not production.running_unit_tests()
+        assert self.app.is_production()
+        assert not self.app.is_local()
+        assert not self.app.running_unit_tests()
 
-        testing = Application()
-        testing["env"] = "testing"
+        self.app["env"] = "testing"
 
-        assert testing.running_unit_tests()
-        assert not testing.is_local()
-        assert not testing.is_production()
+        assert self.app.running_unit_tests()
+        assert not self.app.is_local()
+        assert not self.app.is_production()
 
     def test_environment(self):
         """Test that environment method returns current environment and checks against patterns."""
-        from elyx.foundation import Application
-
-        app = Application()
-        app["env"] = "foo"
+        self.app["env"] = "foo"
 
-        assert "foo" == app.environment()
+        assert "foo" == self.app.environment()
 
-        assert app.environment("foo")
-        assert app.environment("f*")
-        assert app.environment("foo", "bar")
-        assert app.environment(["foo", "bar"])
+        assert self.app.environment("foo")
+        assert self.app.environment("f*")
+        assert self.app.environment("foo", "bar")
+        assert self.app.environment(["foo", "bar"])
 
-        assert not app.environment("qux")
-        assert not app.environment("q*")
-        assert not app.environment("qux", "bar")
-        assert not app.environment(["qux", "bar"])
+        assert not self.app.environment("qux")
+        assert not self.app.environment("q*")
+        assert not self.app.environment("qux", "bar")
+        assert not self.app.environment(["qux", "bar"])
 
     def test_deferred_service_is_loaded_when_accessing_implementation_through_interface(self):
         """Test that deferred service is loaded when accessing implementation through interface."""
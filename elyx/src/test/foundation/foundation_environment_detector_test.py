@@ -37,6 +37,14 @@ class TestEnvironmentDetector(BaseTest):
 
         assert "foobar" == result
 
+    def test_console_environment_detection_followed_by_another_option(self):
+        """Test console environment detection with --env followed by another option falls back to callback."""
+        env = EnvironmentDetector()
+
+        result = env.detect(lambda: "foobar", ["--env", "--verbose"])
+
+        assert "foobar" == result
+
     def test_console_environment_detection_does_not_use_argument_that_starts_with_env(self):
         """Test that arguments starting with 'env' but not '--env' are ignored."""
         env = EnvironmentDetector()
@@ -23,7 +23,15 @@ def main():
             "forget to activate a virtual environment?"
         ) from exc
 
-    asyncio.run(application.handle_command(sys.argv))
+    # uvloop is optional; its event loop makes the awaits of a command cheaper when installed
+    try:
+        import uvloop  # ty:ignore[unresolved-import]
+
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+
+    run(application.handle_command(sys.argv))
 
 
 if __name__ == "__main__":